@@ -0,0 +1,648 @@
+"""
+Benchmarks for the nbafg scraping and processing hot paths.
+Runs against a synthetic basketball-reference style totals page unless
+a saved page is given with --page.
+
+Usage:
+    python benchmark.py parse
+    python benchmark.py parse --rows 2000 --repeat 10
+    python benchmark.py parse --page saved/NBA_2026_totals.html
+    python benchmark.py pipeline --seasons 40
+    python benchmark.py render --rows 500 --seasons 20
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from html import escape
+
+from bs4 import BeautifulSoup
+
+import nbafg
+
+TEAMS = ['ATL', 'BOS', 'BRK', 'CHO', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW', 'HOU', 'IND', 'LAC', 'LAL',
+         'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SAC', 'SAS',
+         'TOR', 'UTA', 'WAS']
+
+# Column layout of basketball-reference's per-season totals table
+TOTALS_COLUMNS = ['ranker', 'name_display', 'age', 'team_name_abbr', 'pos', 'games', 'games_started',
+                  'mp', 'fg', 'fga', 'fg_pct', 'fg3', 'fg3a', 'fg3_pct', 'fg2', 'fg2a', 'fg2_pct',
+                  'efg_pct', 'ft', 'fta', 'ft_pct', 'orb', 'drb', 'trb', 'ast', 'stl', 'blk', 'tov',
+                  'pf', 'pts', 'awards']
+
+
+# Header names the original positional parser looked columns up by
+BS4_CANDIDATES = {
+    'rank': ['rank', 'Rk', '#'],
+    'g': ['g', 'G', 'games'],
+    'fg_pct': ['fg_pct', 'FG%'],
+    'fg2': ['fg2', '2P'],
+    'fg2a': ['fg2a', '2PA'],
+    'fg3': ['fg3', '3P'],
+    'fg3a': ['fg3a', '3PA'],
+}
+
+
+# ──────────────────────────────────────────────
+# SYNTHETIC DATA
+# ──────────────────────────────────────────────
+
+def make_totals_rows(n_players, seed=0):
+    """
+    Random per-player totals; every 15th player gets a 2TM row plus two team rows
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_players):
+        name = f"Player {i} Jr." if i % 40 == 0 else f"Player {i}"
+        pid = f"player{i:04d}01"
+        teams = ['2TM'] + rng.sample(TEAMS, 2) if i % 15 == 0 else [rng.choice(TEAMS)]
+        for team in teams:
+            fg2a = rng.randint(0, 900)
+            fg3a = rng.randint(0, 600)
+            rows.append({
+                'rank': i + 1,
+                'player': name,
+                'player_id': pid,
+                'team': team,
+                'g': rng.randint(1, 82),
+                'fg2': rng.randint(0, fg2a),
+                'fg2a': fg2a,
+                'fg3': rng.randint(0, fg3a),
+                'fg3a': fg3a,
+            })
+    return rows
+
+
+def make_totals_page(n_players, seed=0):
+    """
+    Render make_totals_rows() as a totals page, including the repeated
+    header rows basketball-reference inserts every 20 players
+    """
+    header = '<tr>' + ''.join(f'<th data-stat="{c}">{c}</th>' for c in TOTALS_COLUMNS) + '</tr>'
+    body = []
+    for n, r in enumerate(make_totals_rows(n_players, seed)):
+        fg, fga = r['fg2'] + r['fg3'], r['fg2a'] + r['fg3a']
+        values = {
+            'ranker': r['rank'], 'age': 25, 'pos': 'G', 'games': r['g'], 'games_started': 0, 'mp': 1000,
+            'fg': fg, 'fga': fga, 'fg_pct': f"{fg / fga:.3f}".lstrip('0') if fga else '',
+            'fg3': r['fg3'], 'fg3a': r['fg3a'], 'fg2': r['fg2'], 'fg2a': r['fg2a'],
+        }
+        cells = []
+        for c in TOTALS_COLUMNS:
+            if c == 'ranker':
+                cells.append(f'<th data-stat="ranker">{r["rank"]}</th>')
+            elif c == 'name_display':
+                cells.append(f'<td data-stat="name_display"><a href="/players/p/{r["player_id"]}.html">'
+                             f'{escape(r["player"])}</a></td>')
+            elif c == 'team_name_abbr' and r['team'] in TEAMS:
+                cells.append(f'<td data-stat="team_name_abbr"><a href="/teams/{r["team"]}/2026.html">'
+                             f'{r["team"]}</a></td>')
+            elif c == 'team_name_abbr':
+                cells.append(f'<td data-stat="team_name_abbr">{r["team"]}</td>')
+            else:
+                cells.append(f'<td data-stat="{c}">{values.get(c, 1)}</td>')
+        body.append('<tr>' + ''.join(cells) + '</tr>')
+        if n % 20 == 19:
+            body.append(header.replace('<tr>', '<tr class="thead">', 1))
+    return (f'<html><body><table id="totals_stats"><thead>{header}</thead>'
+            f'<tbody>{"".join(body)}</tbody></table></body></html>')
+
+
+# ──────────────────────────────────────────────
+# HELPERS
+# ──────────────────────────────────────────────
+
+def time_call(fn, repeat):
+    """
+    Run fn `repeat` times; returns (median seconds, last result)
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def time_alternating(fns, repeat):
+    """
+    Run each of `fns` `repeat` times, taking turns so that drifting machine
+    load hits them alike; returns [(median seconds, last result)] in order
+    """
+    timings = [[] for _ in fns]
+    results = [None] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            start = time.perf_counter()
+            results[i] = fn()
+            timings[i].append(time.perf_counter() - start)
+    return [(statistics.median(t), r) for t, r in zip(timings, results)]
+
+
+def report(label, seconds, baseline=None):
+    line = f"  {label:32s} {seconds * 1000:9.2f} ms"
+    if baseline:
+        line += f"   ({baseline / seconds:.1f}x)"
+    print(line)
+
+
+def quietly(fn, *args):
+    """
+    Call fn with stdout suppressed (the pipeline stages log per player)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+def make_season_rows(n_players, seasons=1):
+    """
+    TotalsRow records for `seasons` seasons of n_players each, plus a
+    previous-season lookup, as scrape_totals() would return them
+    """
+    rows = []
+    for season in range(seasons):
+        for r in make_totals_rows(n_players, seed=season):
+            rows.append(nbafg.TotalsRow(f"{r['player']} ({season})", r['team'], r['rank'] + season * n_players,
+                                        r['g'] % 40, 0.45, r['fg2'], r['fg2a'], r['fg3'], r['fg3a'],
+                                        f"{r['player_id']}{season:02d}"))
+    prev_stats = {row.player: row._replace(g=row.g + 20) for row in rows[::3]}
+    return rows, prev_stats
+
+
+def load_page(args):
+    if args.page:
+        with open(args.page, encoding='utf-8') as f:
+            return nbafg.uncomment_tables(f.read())
+    return make_totals_page(args.rows)
+
+
+# ──────────────────────────────────────────────
+# BENCHMARKS
+# ──────────────────────────────────────────────
+
+def bs4_extract(html, candidates):
+    """
+    The original BeautifulSoup/html.parser tree walk, kept as the baseline
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', id='totals_stats') or soup.find('table')
+    header_to_idx = {}
+    for idx, th in enumerate(table.find('thead').find_all('tr')[-1].find_all('th')):
+        if th.get('data-stat'):
+            header_to_idx[th.get('data-stat')] = idx
+        if th.get_text(strip=True):
+            header_to_idx[th.get_text(strip=True)] = idx
+    idx_map = {key: next((header_to_idx[n] for n in names if n in header_to_idx), None)
+               for key, names in candidates.items()}
+    rows = []
+    for row in table.find_all('tr')[1:]:
+        cells = row.find_all(['th', 'td'])
+        player_name = None
+        for cell in cells[:4]:
+            link = cell.find('a')
+            if link and '/players/' in str(link.get('href', '')):
+                player_name = link.text.strip()
+                break
+        if not player_name:
+            continue
+        col_values = [cell.text.strip() for cell in cells]
+        out = {'Player': player_name}
+        for key, idx in idx_map.items():
+            if idx is not None and idx < len(cells):
+                out[key] = cells[idx].text.strip()
+        out['_values'] = col_values
+        rows.append(out)
+    return idx_map, rows
+
+
+def previous_derive_player_stats(rows, prev_stats):
+    """
+    derive_player_stats() as it was before TotalsRowParser (verbatim apart from
+    the nbafg. prefixes), kept as the baseline for the rows benchmark.
+    Turn decoded totals rows into PlayerStat records (FG%, 2P%, 3P%, Made 2
+    likelihood, first-made label). Players with fewer than 15 games are
+    averaged with their previous season totals when available.
+    """
+    players = []
+
+    for row in rows:
+        try:
+            player_name = row.player
+
+            # Skip rows without a real player name or NBA team
+            if player_name.isdigit() or row.team not in nbafg.TEAM_CODES:
+                continue
+
+            team = 'PHX' if row.team == 'PHO' else row.team
+
+            rank = row.rank
+            fg_pct = row.fg_pct
+            fg2_made = row.fg2
+            fg2_att = row.fg2a
+            fg3_made = row.fg3
+            fg3_att = row.fg3a
+            current_g = row.g
+
+            # Helper to canonicalize names (remove Jr./Sr. suffixes and dots)
+            def canon_name(n):
+                if not n:
+                    return n
+                s = n.replace('.', '').replace(',', '')
+                tokens = s.split()
+                # remove common suffixes
+                suffixes = set(['Jr', 'Sr', 'II', 'III', 'IV'])
+                if tokens and tokens[-1] in suffixes:
+                    tokens = tokens[:-1]
+                return ' '.join(tokens)
+
+            used_prev = False
+            # If player has less than 15 games, try to average with previous season totals
+            if current_g < 15 and prev_stats:
+                prev = prev_stats.get(player_name)
+                if not prev:
+                    prev = prev_stats.get(canon_name(player_name))
+                if prev and prev.g > 0:
+                    try:
+                        # convert current to ints where appropriate
+                        c_fg2 = int(round(fg2_made))
+                        c_fg2a = int(round(fg2_att))
+                        c_fg3 = int(round(fg3_made))
+                        c_fg3a = int(round(fg3_att))
+
+                        p_fg2 = prev.fg2
+                        p_fg2a = prev.fg2a
+                        p_fg3 = prev.fg3
+                        p_fg3a = prev.fg3a
+
+                        # Average the raw totals
+                        avg_fg2 = (c_fg2 + p_fg2) / 2.0
+                        avg_fg2a = (c_fg2a + p_fg2a) / 2.0
+                        avg_fg3 = (c_fg3 + p_fg3) / 2.0
+                        avg_fg3a = (c_fg3a + p_fg3a) / 2.0
+
+                        # Recompute percentages from averaged totals
+                        two_pct = (avg_fg2 / avg_fg2a) if avg_fg2a > 0 else 0.0
+                        three_pct = (avg_fg3 / avg_fg3a) if avg_fg3a > 0 else 0.0
+                        total_made = avg_fg2 + avg_fg3
+                        total_att = avg_fg2a + avg_fg3a
+                        fg_pct = (total_made / total_att) if total_att > 0 else fg_pct
+
+                        # Recompute likelihoods based on averaged made counts
+                        if total_made > 0:
+                            made2_likelihood = (avg_fg2 / total_made) * 100.0
+                        else:
+                            made2_likelihood = 0.0
+
+                        if avg_fg2 > avg_fg3:
+                            first_made_weighted = 'Made 2 (Avg)'
+                        elif avg_fg3 > avg_fg2:
+                            first_made_weighted = 'Made 3 (Avg)'
+                        else:
+                            first_made_weighted = 'Tied (Avg)'
+
+                        # Choose the better (higher) ranking between current and previous year
+                        try:
+                            prev_rank_val = prev.rank if isinstance(prev.rank, int) else None
+                            cur_rank_val = rank if isinstance(rank, int) else None
+                            if cur_rank_val is None and prev_rank_val is not None:
+                                rank = prev_rank_val
+                            elif prev_rank_val is None and cur_rank_val is not None:
+                                rank = cur_rank_val
+                            elif prev_rank_val is not None and cur_rank_val is not None:
+                                # lower numeric rank is better (1 is best) -> choose min
+                                rank = min(cur_rank_val, prev_rank_val)
+                        except Exception:
+                            pass
+
+                        used_prev = True
+                    except Exception:
+                        # fallback to current-year calculations if averaging fails
+                        used_prev = False
+
+            if not used_prev:
+                # Calculate 2P% and 3P% from made/attempts
+                two_pct = (fg2_made / fg2_att) if fg2_att > 0 else 0.0
+                three_pct = (fg3_made / fg3_att) if fg3_att > 0 else 0.0
+                # Calculate weighted first-made based on made counts
+                made_total = fg2_made + fg3_made
+                if made_total > 0:
+                    made2_likelihood = (fg2_made / made_total) * 100.0
+                else:
+                    made2_likelihood = 0.0
+
+                if fg2_made > fg3_made:
+                    first_made_weighted = 'Made 2'
+                elif fg3_made > fg2_made:
+                    first_made_weighted = 'Made 3'
+                else:
+                    first_made_weighted = 'Tied'
+
+            # end processing for this player
+
+            players.append(nbafg.PlayerStat(
+                player=player_name,
+                team=team,
+                rank=rank,
+                g=current_g,
+                fg_pct=round(fg_pct, 3),
+                two_pct=round(two_pct, 3),
+                three_pct=round(three_pct, 3),
+                first_made_weighted=first_made_weighted,
+                made2_likelihood=round(made2_likelihood, 1),
+            ))
+        except Exception as e:
+            continue
+
+    return players
+
+
+
+def bench_parse(args):
+    """
+    Totals table extraction: BeautifulSoup tree walk vs nbafg.decode_table (lxml, by data-stat)
+    """
+    html = load_page(args)
+    print(f"Page size: {len(html) / 1024:.0f} KiB")
+    bs4_time, (_, bs4_rows) = time_call(lambda: bs4_extract(html, BS4_CANDIDATES), args.repeat)
+    lxml_time, lxml_rows = time_call(
+        lambda: nbafg.decode_table(html, 'totals_stats', nbafg.TotalsRow, nbafg.TOTALS_STATS), args.repeat)
+    print(f"Rows: {len(bs4_rows)} (BeautifulSoup), {len(lxml_rows)} (lxml)")
+    report('BeautifulSoup html.parser', bs4_time)
+    report('decode_table (lxml)', lxml_time, bs4_time)
+
+
+def bench_pipeline(args):
+    """
+    Stats processing: PlayerStat record pipeline vs DataFrame pipeline, at multi-season scale
+    """
+    rows, prev_stats = make_season_rows(args.rows, args.seasons)
+    print(f"Rows: {len(rows)} ({args.seasons} seasons x {args.rows} players)")
+
+    def run_records():
+        return quietly(nbafg.process_players, nbafg.derive_player_stats(rows, prev_stats))
+
+    def run_frame():
+        return quietly(nbafg.process_players_frame, nbafg.derive_player_stats_frame(rows, prev_stats))
+
+    record_time, record_out = time_call(run_records, args.repeat)
+    frame_time, frame_out = time_call(run_frame, args.repeat)
+    print(f"Identical output: {record_out == frame_out}")
+    report('PlayerStat record pipeline', record_time)
+    report('DataFrame pipeline', frame_time, record_time)
+
+
+def bench_rows(args):
+    """
+    Deriving player stats: the previous derive_player_stats() (helpers rebuilt
+    per row) vs the current one built on nbafg.TotalsRowParser
+    """
+    rows, prev_stats = make_season_rows(args.rows, args.seasons)
+    print(f"Rows: {len(rows)} ({args.seasons} seasons x {args.rows} players)")
+
+    (previous_time, previous_out), (current_time, current_out) = time_alternating(
+        [lambda: previous_derive_player_stats(rows, prev_stats),
+         lambda: nbafg.derive_player_stats(rows, prev_stats)], args.repeat)
+    print(f"Identical output: {previous_out == [dataclasses.replace(p, player_id=None) for p in current_out]}")
+    print(f"  per row: previous {previous_time / len(rows) * 1e6:.2f} us, "
+          f"current {current_time / len(rows) * 1e6:.2f} us")
+    report('before TotalsRowParser', previous_time)
+    report('with TotalsRowParser', current_time, previous_time)
+
+
+def traced_peak(fn):
+    """
+    Run fn once under tracemalloc and return (peak bytes, result)
+    """
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def bench_records(args):
+    """
+    Player records: display-keyed dicts vs slotted PlayerStat, memory and throughput
+    """
+    rows, prev_stats = make_season_rows(args.rows, args.seasons)
+    print(f"Rows: {len(rows)} ({args.seasons} seasons x {args.rows} players)")
+    players = quietly(nbafg.derive_player_stats, rows, prev_stats)
+    values = [tuple(getattr(p, f.name) for f in nbafg.fields(p)) for p in players]
+    names = [f.name for f in nbafg.fields(nbafg.PlayerStat)]
+    keys = [nbafg.DISPLAY_KEYS.get(name, name) for name in names]
+
+    def build_records():
+        return [nbafg.PlayerStat(*v) for v in values]
+
+    def build_dicts():
+        return [dict(zip(keys, v)) for v in values]
+
+    record_peak, records = traced_peak(build_records)
+    dict_peak, dicts = traced_peak(build_dicts)
+    print(f"Peak memory, {len(records)} records: dicts {dict_peak / 1e6:.1f} MB, "
+          f"PlayerStat {record_peak / 1e6:.1f} MB ({dict_peak / record_peak:.1f}x smaller)")
+
+    dict_time, _ = time_call(build_dicts, args.repeat)
+    record_time, _ = time_call(build_records, args.repeat)
+    report('build display dicts', dict_time)
+    report('build PlayerStat', record_time, dict_time)
+
+    team, rank, fg_pct = (nbafg.DISPLAY_KEYS.get(k, k) for k in ('team', 'rank', 'fg_pct'))
+    dict_time, _ = time_call(lambda: sorted(dicts, key=lambda p: (p[team], p[rank], -p[fg_pct])), args.repeat)
+    record_time, _ = time_call(lambda: sorted(records, key=lambda p: (p.team, p.rank, -p.fg_pct)), args.repeat)
+    report('sort display dicts', dict_time)
+    report('sort PlayerStat', record_time, dict_time)
+
+
+# Runs the generated page's script under Node against a minimal DOM stub
+# (no layout or HTML parsing; innerHTML creates one element per tag) and
+# prints the median timings as JSON. argv: page path, repeat.
+RENDER_HARNESS = r"""
+const fs = require('fs');
+const {performance} = require('perf_hooks');
+const [pagePath, repeat] = [process.argv[1], Number(process.argv[2])];
+const script = fs.readFileSync(pagePath, 'utf8').match(/<script>([\s\S]*)<\/script>/)[1];
+
+let created = 0;
+class Element {
+    constructor(tag) { created++; this.tagName = tag; this.children = []; this.style = {};
+                       this.className = ''; this.text = ''; this.value = ''; this.scrollTop = 0;
+                       this.clientHeight = 800; this.offsetHeight = 44; }
+    get firstChild() { return this.children[0]; }
+    appendChild(c) { this.children.push(c); return c; }
+    insertBefore(c, ref) { this.children.splice(this.children.indexOf(ref), 0, c); return c; }
+    addEventListener(type, fn) { this['on' + type] = fn; }
+    set textContent(v) { this.children = []; this.text = String(v); }
+    get textContent() { return this.text; }
+    set innerHTML(v) { this.children = (v.match(/<[a-z]+/g) || []).map(t => new Element(t.slice(1))); }
+    count() { return this.children.reduce((n, c) => n + c.count(), 1); }
+}
+const byId = {};
+global.document = {
+    getElementById: id => byId[id] || (byId[id] = new Element('div')),
+    createElement: tag => new Element(tag),
+};
+global.window = {addEventListener() {}};
+global.requestAnimationFrame = fn => fn();
+eval(script + ';global.page = {decodePlayers, populateTable, sortTable, filterTable, loadPlayers, SORT_KEYS,' +
+     'get all() { return allPlayers; }};');
+
+// The page's previous populateTable(): rebuilds every row on each call
+function rebuildTable(tbody, data) {
+    tbody.innerHTML = '';
+    data.forEach(player => {
+        const row = document.createElement('tr');
+        row.innerHTML = `<td><strong>${player['Rank']}</strong></td><td><strong>${player.Player}</strong></td>` +
+            `<td><span class="stat-badge">${player.Team}</span></td><td class="stat">${(player['FG%'] * 100).toFixed(1)}%</td>` +
+            `<td>${(player['2P%'] * 100).toFixed(1)}%</td><td>${(player['3P%'] * 100).toFixed(1)}%</td>` +
+            `<td><strong>${player['Made 2 Likelihood (counts)']}%</strong></td><td><strong>${player['First Made (Weighted)']}</strong></td>`;
+        tbody.appendChild(row);
+    });
+}
+
+// The page's previous sortTable(): a comparator sort on every header click
+function comparatorSort(data, sortKey, isAscending) {
+    return data.sort((a, b) => {
+        const aVal = a[sortKey], bVal = b[sortKey];
+        if (typeof aVal === 'number') return isAscending ? aVal - bVal : bVal - aVal;
+        const comparison = aVal.localeCompare(bVal);
+        return isAscending ? comparison : -comparison;
+    });
+}
+
+function median(fn) {
+    fn();   // warm up the JIT
+    const times = [];
+    for (let i = 0; i < repeat; i++) { const t = performance.now(); fn(); times.push(performance.now() - t); }
+    return times.sort((a, b) => a - b)[Math.floor(times.length / 2)];
+}
+
+page.loadPlayers().then(async payload => {
+    const out = {};
+    out.decode = median(() => page.decodePlayers(payload.players));
+    const players = page.decodePlayers(payload.players);
+    out.rows = players.length;
+    const rebuilt = new Element('tbody');
+    out.rebuild = median(() => rebuildTable(rebuilt, players));
+    out.rebuild_nodes = rebuilt.count();
+    window.onload();   // builds the spacer rows and loads the data
+    await new Promise(resolve => setTimeout(resolve, 0));
+    const tbody = document.getElementById('tableBody');
+    out.render = median(() => page.populateTable(page.all));
+    out.render_nodes = tbody.count();
+    let ascending = false;
+    out.comparator_sort = median(() => page.populateTable(comparatorSort([...page.all], 'Player', ascending = !ascending)));
+    // First click on a column sorts it, unless its order shipped with the
+    // data; later clicks reuse that order
+    out.sort_first = {};
+    for (let column = 0; column < page.SORT_KEYS.length; column++) {
+        const t = performance.now();
+        page.sortTable(column);
+        out.sort_first[page.SORT_KEYS[column]] = performance.now() - t;
+    }
+    out.sort = median(() => page.sortTable(1));
+    for (const [name, query] of [['filter_name', 'player 123'], ['filter_broad', 'player 1']]) {
+        // The page's previous filterTable(): a substring scan of every name
+        out[name + '_scan'] = median(() => page.populateTable(
+            page.all.filter(p => p.Player.toLowerCase().includes(query))));
+        document.getElementById('playerSearch').value = query;
+        out[name] = median(() => page.filterTable());
+    }
+    document.getElementById('playerSearch').value = '';
+    page.populateTable(page.all);
+    const wrapper = document.getElementById('tableWrapper');
+    const before = created;
+    out.scroll = median(() => {
+        for (let i = 1; i <= 100; i++) { wrapper.scrollTop = i * page.all.length * 44 / 100; wrapper.onscroll(); }
+    }) / 100;
+    out.scroll_created = (created - before) / repeat;
+    console.log(JSON.stringify(out));
+});
+"""
+
+
+def bench_render(args):
+    """
+    Table rendering in the generated page (Node + DOM stub): full rebuild vs virtual scrolling
+    """
+    node = shutil.which('node')
+    if node is None:
+        print("  node not found on PATH; skipped")
+        return
+    rows, prev_stats = make_season_rows(args.rows, args.seasons)
+    players = quietly(nbafg.derive_player_stats, rows, prev_stats)
+    with tempfile.TemporaryDirectory() as tmp:
+        page = f"{tmp}/index.html"
+        with open(page, 'w', encoding='utf-8') as f:
+            f.write(nbafg.create_interactive_html(players))
+        proc = subprocess.run([node, '-e', RENDER_HARNESS, page, str(args.repeat)],
+                              capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(f"  render harness failed:\n{proc.stderr.strip()}")
+        return
+    out = json.loads(proc.stdout)
+    print(f"Rows: {out['rows']} ({args.seasons} seasons x {args.rows} players)")
+    print(f"  tbody elements: full rebuild {out['rebuild_nodes']}, virtual {out['render_nodes']}; "
+          f"elements created per scroll frame: {out['scroll_created'] / 100:.1f}")
+    report('decode payload', out['decode'] / 1000)
+    report('full rebuild', out['rebuild'] / 1000)
+    report('virtual render', out['render'] / 1000, out['rebuild'] / 1000)
+    report('comparator sort + render', out['comparator_sort'] / 1000)
+    shipped = [ms for key, ms in out['sort_first'].items() if key in nbafg.SHIPPED_SORT_KEYS]
+    sorted_here = [ms for key, ms in out['sort_first'].items() if key not in nbafg.SHIPPED_SORT_KEYS]
+    report('first click, shipped order', statistics.median(shipped) / 1000, out['comparator_sort'] / 1000)
+    report('first click: sort + render', statistics.median(sorted_here) / 1000, out['comparator_sort'] / 1000)
+    report('later clicks: reuse + render', out['sort'] / 1000, out['comparator_sort'] / 1000)
+    for name, label in (('filter_name', 'name search'), ('filter_broad', 'broad search')):
+        report(f"{label}: scan + render", out[f'{name}_scan'] / 1000)
+        report(f"{label}: index + render", out[name] / 1000, out[f'{name}_scan'] / 1000)
+    report('scroll frame', out['scroll'] / 1000)
+
+
+BENCHMARKS = {
+    'parse': bench_parse,
+    'pipeline': bench_pipeline,
+    'records': bench_records,
+    'rows': bench_rows,
+    'render': bench_render,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark nbafg hot paths.")
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark",
+                        help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--rows", type=int, default=600,
+                        help="Players in the synthetic page/dataset (default: 600)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timed repetitions per variant; the median is reported (default: 5)")
+    parser.add_argument("--seasons", type=int, default=40,
+                        help="Seasons of synthetic rows for the pipeline benchmark (default: 40)")
+    parser.add_argument("--page", type=str, default=None,
+                        help="Saved totals page to use instead of synthetic data")
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.benchmarks or BENCHMARKS:
+        fn = BENCHMARKS[name]
+        print(f"\n[{name}] {fn.__doc__.strip()}")
+        fn(args)
+
+
+if __name__ == "__main__":
+    main()
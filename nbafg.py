@@ -1,7 +1,24 @@
+import argparse
+import atexit
+import csv
+import functools
+import gzip
+import hashlib
 import json
+import os
+import queue
+import re
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+import lxml.html
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,167 +27,689 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+from schedule import ET, fetch_week
+from stats_store import STATS_DB_PATH, StatsStore, diff_rows
 
 # Last updated: December 22, 2025
 
-def scrape_dunk_stats():
+BBREF_BASE_URL = "https://www.basketball-reference.com"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# basketball-reference rate-limits aggressive clients; never have more than
+# this many requests in flight against a single host
+MAX_CONCURRENT_PER_HOST = 2
+
+# Minimum seconds between requests to one host when fetching many pages
+# (backfills, team rosters); basketball-reference allows roughly 20 requests a minute
+BACKFILL_REQUEST_INTERVAL = 3.0
+
+# Pages from finished seasons never change and are cached forever; the
+# current season's pages are refetched (or revalidated) after this many seconds
+CURRENT_SEASON = 2026
+CURRENT_SEASON_TTL = 15 * 60
+# A season is finished (playoffs over) by July 1 of its year
+SEASON_END_MONTH = 7
+# Team roster pages only change with trades and signings
+ROSTER_TTL = 6 * 60 * 60
+PAGE_CACHE_DIR = Path(__file__).parent / '.cache' / 'pages'
+SEASON_URL_RE = re.compile(r'NBA_(\d{4})_')
+TEAM_URL_RE = re.compile(r'/teams/[A-Z]{3}/(\d{4})\.html')
+
+# basketball-reference hides most secondary tables inside HTML comments and
+# un-comments them client-side with JavaScript
+COMMENTED_TABLE_RE = re.compile(r'<!--(\s*(?:<div[^>]*>\s*)*<table\b.*?)-->', re.DOTALL)
+
+# ESPN scoreboard abbreviations that differ from basketball-reference's
+ESPN_TEAM_CODES = {
+    'BKN': 'BRK', 'CHA': 'CHO', 'GS': 'GSW', 'NO': 'NOP', 'NY': 'NYK',
+    'PHX': 'PHO', 'SA': 'SAS', 'UTAH': 'UTA', 'WSH': 'WAS',
+}
+# basketball-reference has a game's box score in the season totals this long
+# after tip-off; a snapshot taken earlier may not include it yet
+GAME_SETTLE_TIME = timedelta(hours=4)
+# Shortest wait between game-aware daemon refreshes
+MIN_REFRESH_INTERVAL = 5 * 60
+
+# Split output (--split-data): index.html is a static shell that loads
+# data/players.<hash>.json through the data/latest.json manifest
+DATA_DIR_NAME = 'data'
+DATA_MANIFEST_NAME = 'latest.json'
+# Older data files kept for pages that loaded a previous manifest
+DATA_FILES_KEPT = 3
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+_host_next_request = {}
+
+
+def get_http_session():
+    """
+    Return the shared requests.Session used for all page fetches.
+    The session keeps a connection pool so repeated requests to
+    basketball-reference reuse the same TCP/TLS connections.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            # Retry connection errors, but don't sleep through a 429's Retry-After
+            # (basketball-reference sends up to an hour); fetch_page gives up instead
+            retries = Retry(total=2, respect_retry_after_header=False)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept': 'text/html,application/xhtml+xml',
+                'Accept-Language': 'en-US,en;q=0.9',
+            })
+            _http_session = session
+    return _http_session
+
+
+def uncomment_tables(html):
+    """
+    Unwrap tables that basketball-reference ships inside HTML comments
+    so they are visible to a plain HTML parser
+    """
+    return COMMENTED_TABLE_RE.sub(lambda m: m.group(1), html)
+
+
+def season_end(season):
+    """
+    Timestamp after which a season's pages no longer change
+    """
+    return datetime(season, SEASON_END_MONTH, 1, tzinfo=timezone.utc).timestamp()
+
+
+def page_ttl(url, fetched_at=None):
+    """
+    Seconds a copy of url fetched at `fetched_at` (a timestamp; default now)
+    stays fresh, or None if it never expires: pages for seasons before
+    CURRENT_SEASON fetched after the season ended. A copy fetched while the
+    season was still running is revalidated like any other page
+    """
+    team = TEAM_URL_RE.search(url)
+    m = SEASON_URL_RE.search(url) or team
+    if m and int(m.group(1)) < CURRENT_SEASON:
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        if fetched_at >= season_end(int(m.group(1))):
+            return None
+    return ROSTER_TTL if team else CURRENT_SEASON_TTL
+
+
+class PageCache:
+    """
+    On-disk page cache keyed by URL. Each entry is the page HTML plus a small
+    JSON sidecar with the fetch time and the ETag/Last-Modified validators.
+    """
+
+    def __init__(self, directory=PAGE_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        return self.directory / f"{key}.html", self.directory / f"{key}.json"
+
+    def get(self, url):
+        """
+        Return (html, meta) for url, or (None, None) if it is not cached
+        """
+        html_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            html = html_path.read_text(encoding='utf-8')
+        except (OSError, ValueError):
+            return None, None
+        return html, meta
+
+    def is_fresh(self, url, meta):
+        fetched_at = meta.get('fetched_at', 0)
+        ttl = page_ttl(url, fetched_at)
+        return ttl is None or time.time() - fetched_at < ttl
+
+    def put(self, url, html, etag=None, last_modified=None):
+        html_path, meta_path = self._paths(url)
+        meta = {
+            'url': url,
+            'fetched_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write(html_path, html)
+        _atomic_write(meta_path, json.dumps(meta))
+
+    def touch(self, url, meta):
+        """
+        Mark a cached entry as freshly validated (after a 304 Not Modified)
+        """
+        meta = dict(meta, fetched_at=time.time())
+        _atomic_write(self._paths(url)[1], json.dumps(meta))
+
+
+def _atomic_write(path, content):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if isinstance(content, bytes):
+        tmp.write_bytes(content)
+    else:
+        tmp.write_text(content, encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def _write_if_changed(path, text):
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return
+    except OSError:
+        pass
+    _atomic_write(path, text)
+
+
+PAGE_CACHE = PageCache()
+
+
+def fetch_html_http(url, timeout=15, cached_meta=None):
+    """
+    Fetch a page with the shared requests session.
+    When `cached_meta` carries ETag/Last-Modified validators a conditional
+    request is sent, and html is None if the server answers 304 Not Modified.
+    Returns (html, response headers). Raises on network errors and non-2xx responses.
+    """
+    headers = {}
+    if cached_meta:
+        if cached_meta.get('etag'):
+            headers['If-None-Match'] = cached_meta['etag']
+        if cached_meta.get('last_modified'):
+            headers['If-Modified-Since'] = cached_meta['last_modified']
+    resp = get_http_session().get(url, timeout=timeout, headers=headers)
+    if resp.status_code == 304:
+        return None, resp.headers
+    resp.raise_for_status()
+    # requests falls back to ISO-8859-1 for text/* without a charset;
+    # basketball-reference is UTF-8 (accented player names)
+    if not resp.encoding or resp.encoding.lower() == 'iso-8859-1':
+        resp.encoding = 'utf-8'
+    return uncomment_tables(resp.text), resp.headers
+
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path():
+    """
+    Resolve (and download if needed) the chromedriver binary once per process
+    """
+    return ChromeDriverManager().install()
+
+
+def create_chrome_driver():
+    """
+    Start a headless Chrome configured for basketball-reference
+    """
+    # Set up Chrome options
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument(f'user-agent={USER_AGENT}')
+
+    return webdriver.Chrome(
+        service=Service(chromedriver_path()),
+        options=options
+    )
+
+
+class DriverPool:
+    """
+    Lazily started pool of headless Chrome drivers shared by all scrapers.
+    Drivers are borrowed with `with pool.driver() as driver:` and stay alive
+    between borrows, so a run launches Chrome at most `size` times.
+    """
+
+    def __init__(self, size=1):
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._drivers = []
+
+    @contextmanager
+    def driver(self):
+        self._slots.acquire()
+        try:
+            try:
+                drv = self._idle.get_nowait()
+            except queue.Empty:
+                drv = create_chrome_driver()
+                with self._lock:
+                    self._drivers.append(drv)
+            try:
+                yield drv
+            except BaseException:
+                # After any failure (a crashed browser, a timeout, Ctrl-C) the
+                # driver may be mid-page; only a clean borrow goes back to the pool
+                self._discard(drv)
+                raise
+            else:
+                self._idle.put(drv)
+        finally:
+            self._slots.release()
+
+    def _discard(self, drv):
+        with self._lock:
+            if drv in self._drivers:
+                self._drivers.remove(drv)
+        try:
+            drv.quit()
+        except:
+            pass
+
+    def close(self):
+        """
+        Quit every driver the pool has started
+        """
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for drv in drivers:
+            try:
+                drv.quit()
+            except:
+                pass
+
+
+DRIVER_POOL = DriverPool()
+atexit.register(DRIVER_POOL.close)
+_session_depth = 0
+_session_lock = threading.Lock()
+
+
+@contextmanager
+def browser_session():
+    """
+    Scope a scrape run: every Selenium fallback inside the block shares the
+    pooled browser, which is shut down when the outermost block exits
+    (so a daemon can hold one session open across many runs)
+    """
+    global _session_depth
+    with _session_lock:
+        _session_depth += 1
+    try:
+        yield DRIVER_POOL
+    finally:
+        with _session_lock:
+            _session_depth -= 1
+            last = _session_depth == 0
+        if last:
+            DRIVER_POOL.close()
+
+
+def fetch_html_selenium(url, wait=20):
+    """
+    Fetch a page with a pooled headless Chrome. Slow; only used when the HTTP path fails.
+    Returns the page source, or None if the table never loaded.
+    """
+    try:
+        with DRIVER_POOL.driver() as driver:
+            print(f"Loading {url} with Selenium...")
+            driver.get(url)
+
+            # Wait for table to load
+            try:
+                WebDriverWait(driver, wait).until(
+                    EC.presence_of_all_elements_located((By.TAG_NAME, "tbody"))
+                )
+            except:
+                print("Timeout waiting for table")
+                return None
+
+            time.sleep(2)
+            return uncomment_tables(driver.page_source)
+    except Exception as e:
+        print(f"Selenium fetch failed: {str(e)[:150]}")
+        return None
+
+
+def fetch_page(url, cache=PAGE_CACHE, min_interval=0):
+    """
+    Fetch a stats page, trying a plain HTTP request first and falling back
+    to headless Chrome only if that fails or returns no table. A 429 Too
+    Many Requests is not retried in the browser, which would only hit the
+    same rate limit again.
+    Fresh cache hits skip the network entirely; stale entries are
+    revalidated with a conditional request. Pass cache=None to bypass the cache.
+    Network fetches wait until `min_interval` seconds after the previous
+    request to the same host (see wait_for_host).
+    Returns the page HTML or None.
+    """
+    cached_html, meta = cache.get(url) if cache else (None, None)
+    if cached_html is not None and cache.is_fresh(url, meta):
+        print(f"Using cached {url}")
+        return cached_html
+
+    if min_interval:
+        wait_for_host(url, min_interval)
+    print(f"Loading {url}...")
+    try:
+        html, headers = fetch_html_http(url, cached_meta=meta if cached_html is not None else None)
+        if html is None:
+            print(f"Not modified, using cached {url}")
+            cache.touch(url, meta)
+            return cached_html
+        if '<table' in html:
+            if cache:
+                cache.put(url, html, headers.get('ETag'), headers.get('Last-Modified'))
+            return html
+        print(f"No table in HTTP response for {url}, falling back to Selenium")
+    except requests.HTTPError as e:
+        print(f"HTTP fetch failed for {url}: {str(e)[:150]}")
+        if e.response is not None and e.response.status_code == 429:
+            if cached_html is not None:
+                print(f"Rate limited, using stale cached copy of {url}")
+            return cached_html
+    except Exception as e:
+        print(f"HTTP fetch failed for {url}: {str(e)[:150]}")
+
+    html = fetch_html_selenium(url)
+    if html and cache:
+        cache.put(url, html)
+    if html is None and cached_html is not None:
+        print(f"Fetch failed, using stale cached copy of {url}")
+        return cached_html
+    return html
+
+
+def host_slot(url):
+    """
+    Return the semaphore limiting concurrent requests to url's host
+    """
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(MAX_CONCURRENT_PER_HOST)
+    return slot
+
+
+def wait_for_host(url, min_interval):
+    """
+    Sleep until at least `min_interval` seconds have passed since the last
+    request slot handed out for url's host, then claim the next slot
+    """
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        now = time.monotonic()
+        start = max(now, _host_next_request.get(host, now))
+        _host_next_request[host] = start + min_interval
+    if start > now:
+        time.sleep(start - now)
+
+
+def fetch_pages(urls, max_workers=4, cache=PAGE_CACHE, min_interval=0):
+    """
+    Fetch several pages concurrently, at most MAX_CONCURRENT_PER_HOST at a
+    time per host and (when min_interval is set) no more than one request
+    per host every min_interval seconds. Returns {url: html or None} in the order given.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+
+    def fetch_one(url):
+        with host_slot(url):
+            return fetch_page(url, cache=cache, min_interval=min_interval)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return dict(zip(urls, executor.map(fetch_one, urls)))
+
+
+def season_page_urls(base_url=BBREF_BASE_URL, include_shooting=False):
+    """
+    URLs of every page a scrape run needs
+    """
+    urls = {
+        'totals': season_totals_url(CURRENT_SEASON, base_url),
+        'prev_totals': season_totals_url(CURRENT_SEASON - 1, base_url),
+    }
+    if include_shooting:
+        urls['shooting'] = f"{base_url}/leagues/NBA_{CURRENT_SEASON}_shooting.html"
+    return urls
+
+
+def season_totals_url(season, base_url=BBREF_BASE_URL):
+    """
+    Totals page of the season ending in `season` (2026 is 2025-26)
+    """
+    return f"{base_url}/leagues/NBA_{season}_totals.html"
+
+
+# Every team code a totals/shooting row may carry, including the combined
+# rows for players traded mid-season
+TEAM_CODES = frozenset([
+    'ATL', 'BOS', 'BRK', 'CHO', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW', 'HOU', 'IND', 'LAC', 'LAL',
+    'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SAC', 'SAS',
+    'TOR', 'UTA', 'WAS', '2TM', '3TM',
+])
+
+# data-stat names of the player name cell (current and older page layouts)
+PLAYER_STATS = frozenset(['name_display', 'player'])
+
+# basketball-reference player ID in a /players/<letter>/<id>.html link
+PLAYER_ID_RE = re.compile(r'/players/[^/]+/([^/.]+)\.html')
+
+
+class TotalsRow(NamedTuple):
+    """
+    One row of a season totals table
+    """
+    player: str
+    team: Optional[str] = None
+    rank: Optional[int] = None
+    g: int = 0
+    fg_pct: float = 0.0
+    fg2: int = 0
+    fg2a: int = 0
+    fg3: int = 0
+    fg3a: int = 0
+    player_id: Optional[str] = None
+
+
+class ShootingRow(NamedTuple):
+    """
+    One row of a season shooting table
+    """
+    player: str
+    team: Optional[str] = None
+    dunk_pct: float = 0.0
+    dunk: int = 0
+    player_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class PlayerStat:
+    """
+    One player row as it moves through the scrape and post-processing
+    pipeline. Converted to the display dict shape (see DISPLAY_KEYS) only
+    when the HTML is generated; fields left as None are omitted there.
+    player_id (the basketball-reference ID) identifies the player for
+    grouping and is not displayed.
+    """
+    player: str
+    team: str
+    rank: Optional[int] = None
+    g: Optional[int] = None
+    fg_pct: Optional[float] = None
+    two_pct: Optional[float] = None
+    three_pct: Optional[float] = None
+    first_made_weighted: Optional[str] = None
+    made2_likelihood: Optional[float] = None
+    first_made: Optional[str] = None
+    team_rank: Optional[int] = None
+    team_total: Optional[int] = None
+    player_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a PlayerStat from a display-shaped dict (e.g. create_sample_data())
+        """
+        return cls(**{field: data[key] for field, key in DISPLAY_KEYS.items() if key in data})
+
+    def to_display_dict(self):
+        """
+        Display-shaped dict used by the generated page
+        """
+        out = {}
+        for field, key in DISPLAY_KEYS.items():
+            value = getattr(self, field)
+            if value is not None:
+                out[key] = value
+        return out
+
+
+# PlayerStat field -> key in the page's player objects
+DISPLAY_KEYS = {
+    'player': 'Player',
+    'team': 'Team',
+    'rank': 'Rank',
+    'g': 'G',
+    'fg_pct': 'FG%',
+    'two_pct': '2P%',
+    'three_pct': '3P%',
+    'first_made_weighted': 'First Made (Weighted)',
+    'made2_likelihood': 'Made 2 Likelihood (counts)',
+    'first_made': 'First Made',
+    'team_rank': 'Team Rank',
+    'team_total': 'Team Total Players',
+}
+
+
+# data-stat -> (record field, parser). Several data-stat names map to the
+# same field because basketball-reference has renamed columns over the years.
+TOTALS_STATS = {
+    'ranker': ('rank', int),
+    'rank': ('rank', int),
+    'team_name_abbr': ('team', str),
+    'team_id': ('team', str),
+    'team': ('team', str),
+    'games': ('g', int),
+    'g': ('g', int),
+    'fg_pct': ('fg_pct', float),
+    'fg2': ('fg2', int),
+    'fg2a': ('fg2a', int),
+    'fg3': ('fg3', int),
+    'fg3a': ('fg3a', int),
+}
+
+SHOOTING_STATS = {
+    'team_name_abbr': ('team', str),
+    'team_id': ('team', str),
+    'team': ('team', str),
+    'pct_fga_dunk': ('dunk_pct', float),
+    'dunk_pct': ('dunk_pct', float),
+    'fg_dunk': ('dunk', int),
+    'dunk': ('dunk', int),
+}
+
+
+def decode_table(html, table_id, record_type, stat_fields):
+    """
+    Decode a stats table into `record_type` records in a single lxml pass,
+    reading each cell by its data-stat attribute (see TOTALS_STATS).
+    Empty or unparseable cells keep the record's default value. Rows without
+    a /players/ link (repeated header rows, league averages) are skipped.
+    The player ID from that link fills `player_id` when the record has one.
+    Returns None if the page has no table.
+    """
+    root = lxml.html.fromstring(html)
+    tables = root.xpath('//table[@id=$table_id]', table_id=table_id) or root.xpath('//table')
+    if not tables:
+        return None
+
+    wants_id = 'player_id' in record_type._fields
+    records = []
+    for tr in tables[0].iter('tr'):
+        player = None
+        values = {}
+        for cell in tr:
+            stat = cell.get('data-stat')
+            if stat is None:
+                continue
+            if stat in PLAYER_STATS:
+                for a in cell.iter('a'):
+                    href = a.get('href', '')
+                    if '/players/' in href:
+                        player = a.text_content().strip()
+                        if wants_id:
+                            m = PLAYER_ID_RE.search(href)
+                            if m:
+                                values['player_id'] = m.group(1)
+                        break
+                continue
+            spec = stat_fields.get(stat)
+            if spec is None:
+                continue
+            text = cell.text_content().strip()
+            if text:
+                field, parse = spec
+                try:
+                    values[field] = parse(text)
+                except ValueError:
+                    pass
+        if player:
+            records.append(record_type(player, **values))
+    return records
+
+
+def scrape_dunk_stats(base_url=BBREF_BASE_URL, pages=None):
     """
     Scrape NBA player dunk stats from basketball-reference.com shooting page
     Returns a list with player dunk stats including Dunks % FGA and Dunks count
+    `pages` is an optional {url: html} dict from fetch_pages()
     """
     print("Scraping NBA player dunk stats from basketball-reference.com...")
     
-    driver = None
     try:
-        # Set up Chrome options
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options
-        )
-        
-        url = "https://www.basketball-reference.com/leagues/NBA_2026_shooting.html"
-        print(f"Loading {url}...")
-        driver.get(url)
-        
-        # Wait for table to load
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "tbody"))
-            )
-        except:
-            print("Timeout waiting for table")
-            driver.quit()
+        url = season_page_urls(base_url, include_shooting=True)['shooting']
+        html = pages.get(url) if pages else fetch_page(url)
+        if not html:
             return None
         
-        time.sleep(2)
+        rows = decode_table(html, 'shooting_stats', ShootingRow, SHOOTING_STATS)
         
-        # Parse the page
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        table = soup.find('table')
-        
-        if not table:
+        if rows is None:
             print("Could not find table")
-            driver.quit()
             return None
         
-        # Build header -> index map from table header
-        header_to_idx = {}
-        thead = table.find('thead')
-        if thead:
-            header_rows = thead.find_all('tr')
-            header_cells = header_rows[-1].find_all('th')
-        else:
-            header_cells = []
-        
-        for idx, th in enumerate(header_cells):
-            data_stat = th.get('data-stat')
-            text = th.get_text(strip=True)
-            if data_stat:
-                header_to_idx[data_stat] = idx
-            if text:
-                header_to_idx[text] = idx
-        
-        # Find column indices for dunk stats
-        # Looking for: Dunks (dunk_pct), Dunks count (dunk)
-        candidates = {
-            'dunk_pct': ['dunk_pct', 'Dunk%', 'Dunks %FGA'],
-            'dunk': ['dunk', 'Dunks', 'Dunks #'],
-        }
-        
-        idx_map = {}
-        for key, names in candidates.items():
-            for name in names:
-                if name in header_to_idx:
-                    idx_map[key] = header_to_idx[name]
-                    break
-        
-        rows = table.find_all('tr')[1:]  # Get all data rows
         players = []
         
         print(f"Found {len(rows)} rows")
-        print(f"Detected header indices: {idx_map}")
         
         for row in rows:
-            cells = row.find_all(['th', 'td'])
-            if not cells:
+            # Skip rows without a real player name or NBA team
+            if row.player.isdigit() or row.team not in TEAM_CODES:
                 continue
             
-            try:
-                # Extract player name from link with href containing /players/
-                player_name = None
-                for cell in cells[:4]:
-                    link = cell.find('a')
-                    if link and '/players/' in str(link.get('href', '')):
-                        player_name = link.text.strip()
-                        break
-                
-                # Skip rows without player link
-                if not player_name or player_name.isdigit():
-                    continue
-                
-                col_values = [cell.text.strip() for cell in cells]
-                
-                # Find team - NBA team abbreviations or 2TM (2 teams)
-                nba_teams = ['ATL', 'BOS', 'BRK', 'CHO', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW', 'HOU', 'IND', 'LAC', 'LAL', 
-                             'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SAC', 'SAS', 
-                             'TOR', 'UTA', 'WAS', '2TM', '3TM']
-                
-                team = None
-                for val in col_values:
-                    if val in nba_teams:
-                        team = val
-                        break
-                
-                if team == 'PHO':
-                    team = 'PHX'
-                
-                if not team:
-                    continue
-                
-                # Helper to safely parse floats at specific indices
-                def parse_at(key):
-                    try:
-                        idx = idx_map.get(key)
-                        if idx is None or idx >= len(cells):
-                            return 0.0
-                        val_str = cells[idx].text.strip()
-                        return float(val_str) if val_str else 0.0
-                    except:
-                        return 0.0
-                
-                # Helper to safely parse integers
-                def parse_int_at(key):
-                    try:
-                        idx = idx_map.get(key)
-                        if idx is None or idx >= len(cells):
-                            return 0
-                        val_str = cells[idx].text.strip()
-                        return int(val_str) if val_str else 0
-                    except:
-                        return 0
-                
-                dunk_pct = parse_at('dunk_pct')
-                dunk_count = parse_int_at('dunk')
-                
-                players.append({
-                    'Player': player_name,
-                    'Team': team,
-                    'Dunk %FGA': round(dunk_pct, 3),
-                    'Dunks': dunk_count,
-                })
-            except Exception as e:
-                continue
-        
-        driver.quit()
+            team = 'PHX' if row.team == 'PHO' else row.team
+            
+            players.append({
+                'Player': row.player,
+                'Team': team,
+                'Dunk %FGA': round(row.dunk_pct, 3),
+                'Dunks': row.dunk,
+                'Player ID': row.player_id,
+            })
         
         if len(players) > 100:
             print(f"✅ Successfully scraped {len(players)} live NBA players dunk stats!")
@@ -180,365 +719,531 @@ def scrape_dunk_stats():
             return None
             
     except Exception as e:
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass
         print(f"Scraping failed: {str(e)[:150]}")
         return None
 
 
-def scrape_nba_stats():
+@functools.lru_cache(maxsize=4)
+def decode_totals(html):
     """
-    Scrape NBA player FG% data from basketball-reference.com using Selenium
-    Returns a list with player stats including FG%, 2P%, 3P%
+    decode_table() for a totals page, memoized on the page text so a
+    long-running process decodes an unchanged page (e.g. last season's) once.
+    Returns a tuple of TotalsRow, or None
+    """
+    rows = decode_table(html, 'totals_stats', TotalsRow, TOTALS_STATS)
+    return tuple(rows) if rows is not None else None
+
+
+def scrape_totals(base_url=BBREF_BASE_URL, pages=None):
+    """
+    Fetch and decode the current and previous season totals tables
+    Returns (rows, prev_stats): the current season's TotalsRow records and a
+    player_name -> TotalsRow lookup for last season, or None on failure
+    `pages` is an optional {url: html} dict from fetch_pages(); when omitted
+    both pages are fetched concurrently
     """
-    print("Scraping NBA player stats from basketball-reference.com...")
-    
-    driver = None
     try:
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        import time
-        
-        # Set up Chrome options
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options
-        )
-        
-        url = "https://www.basketball-reference.com/leagues/NBA_2026_totals.html"
-        print(f"Loading {url}...")
-        driver.get(url)
-        
-        # Wait for table to load
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "tbody"))
-            )
-        except:
-            print("Timeout waiting for table")
-            driver.quit()
+        urls = season_page_urls(base_url)
+        url = urls['totals']
+        # We'll fetch last year's totals as a fallback for low-appearance players
+        prev_url = urls['prev_totals']
+        if pages is None:
+            pages = fetch_pages([url, prev_url])
+        html = pages.get(url)
+        if not html:
             return None
         
-        time.sleep(2)
-        
         # Parse the page
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        table = soup.find('table')
+        rows = decode_totals(html)
         
-        if not table:
+        if rows is None:
             print("Could not find table")
-            driver.quit()
             return None
-        
-        # We'll fetch last year's totals as a fallback for low-appearance players
-        prev_url = "https://www.basketball-reference.com/leagues/NBA_2025_totals.html"
 
-        # Save current page soup/table
-        soup_curr = soup
-        table_curr = table
-
-        # Load previous year page
+        # Parse previous year page
         try:
-            driver.get(prev_url)
-            WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'tbody')))
-            time.sleep(1)
-            soup_prev = BeautifulSoup(driver.page_source, 'html.parser')
-            table_prev = soup_prev.find('table')
+            prev_html = pages.get(prev_url)
+            prev_rows = decode_totals(prev_html) if prev_html else None
         except Exception:
-            table_prev = None
-
-        def build_idx_map(table_obj):
-            hdr_map = {}
-            if not table_obj:
-                return hdr_map
-            thead = table_obj.find('thead')
-            if thead:
-                header_rows = thead.find_all('tr')
-                header_cells = header_rows[-1].find_all('th')
-            else:
-                header_cells = []
-            for idx, th in enumerate(header_cells):
-                data_stat = th.get('data-stat')
-                text = th.get_text(strip=True)
-                if data_stat:
-                    hdr_map[data_stat] = idx
-                if text:
-                    hdr_map[text] = idx
-            return hdr_map
-
-        # Candidates for columns
-        candidates = {
-            'rank': ['rank', 'Rk', '#'],
-            'g': ['g', 'G', 'games'],
-            'fg_pct': ['fg_pct', 'FG%'],
-            'fg2': ['fg2', '2P'],
-            'fg2a': ['fg2a', '2PA'],
-            'fg3': ['fg3', '3P'],
-            'fg3a': ['fg3a', '3PA'],
-        }
+            prev_rows = None
+
+        # Build previous-year lookup mapping player_name -> TotalsRow (if prev table present)
+        prev_stats = {r.player: r for r in prev_rows or []}
+
+        print(f"Found {len(rows)} rows")
+        return rows, prev_stats
 
-        hdr_curr = build_idx_map(table_curr)
-        hdr_prev = build_idx_map(table_prev)
+    except Exception as e:
+        print(f"Scraping failed: {str(e)[:150]}")
+        return None
+
+
+# Name suffixes dropped when matching a player across seasons
+NAME_SUFFIXES = frozenset(['jr', 'sr', 'ii', 'iii', 'iv'])
+
+
+@functools.lru_cache(maxsize=65536)
+def canon_name(n):
+    """
+    Canonicalize a player name for cross-season matching: fold accents
+    ('Schröder' -> 'schroder'), case and punctuation, and drop a trailing
+    Jr/Sr/II/III/IV
+    """
+    if not n:
+        return n
+    # Most names are plain ASCII and have no accents to fold
+    folded = n if n.isascii() else ''.join(c for c in unicodedata.normalize('NFKD', n)
+                                            if not unicodedata.combining(c))
+    tokens = folded.casefold().replace('.', '').replace(',', '').replace("'", '').split()
+    if tokens and tokens[-1] in NAME_SUFFIXES:
+        tokens = tokens[:-1]
+    return ' '.join(tokens)
+
+
+def player_key(row):
+    """
+    Identity of a row's player: the basketball-reference ID when the row
+    has one, otherwise the name
+    """
+    return getattr(row, 'player_id', None) or row.player
+
+
+def build_name_index(rows):
+    """
+    canonical name -> player_key for one season's rows (first row wins).
+    Built once per season and persisted with it (StatsStore.save_name_index)
+    """
+    index = {}
+    for row in rows:
+        index.setdefault(canon_name(row.player), player_key(row))
+    return index
+
+
+# Bump when TotalsRowParser's arithmetic changes, so cached derived rows are recomputed
+DERIVED_CACHE_VERSION = 3
+
+# PlayerStat fields set by TotalsRowParser (what DerivedCache keeps per row)
+DERIVED_FIELDS = ('player', 'team', 'rank', 'g', 'fg_pct', 'two_pct', 'three_pct',
+                  'first_made_weighted', 'made2_likelihood', 'player_id')
+DERIVED_PLAYER, DERIVED_TEAM, DERIVED_RANK, DERIVED_G, DERIVED_ID = (
+    DERIVED_FIELDS.index(f) for f in ('player', 'team', 'rank', 'g', 'player_id'))
+
+
+class DerivedCache:
+    """
+    Previously derived PlayerStat values keyed by TotalsRowParser.row_key(),
+    so rows whose totals did not change since the last run are not recomputed.
+    `used` collects the entries of this run (to persist with
+    StatsStore.save_derived); hits/misses count reused and recomputed rows.
+    `played_teams` (team codes with a game final since the last run, see
+    plan_refresh) and `changed` (diff_rows keys of the rows that changed or
+    were added since the last snapshot) let unchanged rows of every other
+    team reuse their cached values without hashing their inputs.
+    """
+
+    def __init__(self, entries=None, played_teams=None, changed=None):
+        self.entries = entries or {}
+        self.played_teams = played_teams
+        self.changed = changed
+        self.used = {}
+        self.hits = 0
+        self.misses = 0
+        self._by_player = None
+
+    def unplayed_key(self, row):
+        """
+        Cached key of a row whose team has not played since the last run and
+        which is identical to its row in the last snapshot, or None.
+        Rows under 15 games are left to row_key(), since their values also
+        depend on the previous-season row they blend with.
+        """
+        if (self.played_teams is None or self.changed is None or row.g < 15
+                or row.team in self.played_teams or row.team in COMBINED_TEAMS
+                or (row.player_id or row.player, row.team) in self.changed):
+            return None
+        if self._by_player is None:
+            prefix = f"{DERIVED_CACHE_VERSION}-"
+            self._by_player = {(values[DERIVED_ID] or values[DERIVED_PLAYER], values[DERIVED_TEAM]): key
+                               for key, values in self.entries.items() if key.startswith(prefix)}
+        key = self._by_player.get((row.player_id or row.player, 'PHX' if row.team == 'PHO' else row.team))
+        if key is None:
+            return None
+        values = self.entries[key]
+        return key if values[DERIVED_G] == row.g and values[DERIVED_RANK] == row.rank else None
 
-        def find_idx(hdr_map, candidates_list):
-            for c in candidates_list:
-                if c in hdr_map:
-                    return hdr_map[c]
+    def get(self, key):
+        """
+        A fresh PlayerStat for a cached key, or None
+        """
+        values = self.entries.get(key)
+        if values is None:
             return None
+        self.hits += 1
+        self.used[key] = values
+        return PlayerStat(**dict(zip(DERIVED_FIELDS, values)))
 
-        idx_map_curr = {}
-        idx_map_prev = {}
-        for key, names in candidates.items():
-            idx_map_curr[key] = find_idx(hdr_curr, names)
-            idx_map_prev[key] = find_idx(hdr_prev, names)
-
-        # Build previous-year lookup mapping player_name -> stats (if table_prev present)
-        prev_stats = {}
-        if table_prev:
-            for r in table_prev.find_all('tr')[1:]:
-                cells_prev = r.find_all(['th', 'td'])
-                if not cells_prev:
-                    continue
-                # extract player name via link
-                pname = None
-                for c in cells_prev[:4]:
-                    a = c.find('a')
-                    if a and '/players/' in str(a.get('href', '')):
-                        pname = a.text.strip()
-                        break
-                if not pname:
-                    continue
+    def add(self, key, player):
+        self.misses += 1
+        self.used[key] = [getattr(player, f) for f in DERIVED_FIELDS]
 
-                def parse_val(cells, idx, is_int=False):
-                    try:
-                        if idx is None or idx >= len(cells):
-                            return 0 if is_int else 0.0
-                        txt = cells[idx].get_text(strip=True)
-                        if txt == '':
-                            return 0 if is_int else 0.0
-                        return int(txt) if is_int else float(txt)
-                    except:
-                        return 0 if is_int else 0.0
-
-                prev_fg_pct = parse_val(cells_prev, idx_map_prev.get('fg_pct'))
-                prev_rank = parse_val(cells_prev, idx_map_prev.get('rank'), is_int=True)
-                prev_fg2 = parse_val(cells_prev, idx_map_prev.get('fg2'), is_int=True)
-                prev_fg2a = parse_val(cells_prev, idx_map_prev.get('fg2a'), is_int=True)
-                prev_fg3 = parse_val(cells_prev, idx_map_prev.get('fg3'), is_int=True)
-                prev_fg3a = parse_val(cells_prev, idx_map_prev.get('fg3a'), is_int=True)
-                prev_g = parse_val(cells_prev, idx_map_prev.get('g'), is_int=True)
-
-                prev_stats[pname] = {
-                    'rank': prev_rank,
-                    'fg_pct': prev_fg_pct,
-                    'fg2': prev_fg2,
-                    'fg2a': prev_fg2a,
-                    'fg3': prev_fg3,
-                    'fg3a': prev_fg3a,
-                    'g': prev_g,
-                }
-
-        # Now prepare to process current-year rows
-        rows = table_curr.find_all('tr')[1:]
-        players = []
-        
-        print(f"Found {len(rows)} rows")
-        print(f"Detected header indices (current): {idx_map_curr}")
 
-        for row in rows:
-            cells = row.find_all(['th', 'td'])
-            if not cells:
-                continue
-            
-            try:
-                # Extract player name from link with href containing /players/
-                player_name = None
-                for cell in cells[:4]:
-                    link = cell.find('a')
-                    if link and '/players/' in str(link.get('href', '')):
-                        player_name = link.text.strip()
-                        break
-                
-                # Skip rows without player link
-                if not player_name or player_name.isdigit():
-                    continue
-                
-                col_values = [cell.text.strip() for cell in cells]
-                
-                # Find team - NBA team abbreviations or 2TM (2 teams)
-                nba_teams = ['ATL', 'BOS', 'BRK', 'CHO', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW', 'HOU', 'IND', 'LAC', 'LAL', 
-                             'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SAC', 'SAS', 
-                             'TOR', 'UTA', 'WAS', '2TM', '3TM']
-                
-                team = None
-                for val in col_values:
-                    if val in nba_teams:
-                        team = val
-                        break
-                
-                if team == 'PHO':
-                    team = 'PHX'
-                
-                if not team:
+class TotalsRowParser:
+    """
+    Turns TotalsRow records into PlayerStat records. Built once per totals
+    table: the team lookup and the previous season's ID and name indexes are
+    prepared up front, so each row only does the arithmetic.
+    `name_index` is a prebuilt build_name_index() of the previous season(s);
+    when not given it is built from prev_stats the first time a player is
+    not found by ID or exact name.
+    Calling the parser returns None for rows that are not an NBA player.
+    """
+    __slots__ = ('teams', 'prev_stats', 'prev_by_key', '_name_index')
+
+    def __init__(self, prev_stats=None, teams=TEAM_CODES, name_index=None):
+        self.teams = teams
+        self.prev_stats = prev_stats or {}
+        self.prev_by_key = {player_key(prev): prev for prev in self.prev_stats.values()}
+        self._name_index = name_index
+
+    @property
+    def name_index(self):
+        if self._name_index is None:
+            self._name_index = build_name_index(self.prev_stats.values())
+        return self._name_index
+
+    def previous(self, player_name, player_id=None):
+        """
+        Last season's row for a player: by player ID, then exact name, then
+        canonical (accent/suffix-folded) name
+        """
+        prev = self.prev_by_key.get(player_id) if player_id else None
+        if prev is None:
+            prev = self.prev_stats.get(player_name)
+        if prev is None:
+            key = self.name_index.get(canon_name(player_name))
+            if key is not None:
+                prev = self.prev_by_key.get(key)
+        return prev
+
+    def row_key(self, row):
+        """
+        Hash of everything __call__ reads for this row (the row and the
+        previous-season row it would blend with), or None for skipped rows
+        """
+        if row.player.isdigit() or row.team not in self.teams:
+            return None
+        prev = self.previous(row.player, row.player_id) if row.g < 15 and self.prev_stats else None
+        inputs = (tuple(row), tuple(prev) if prev is not None else None)
+        digest = hashlib.blake2b(repr(inputs).encode('utf-8'), digest_size=16).hexdigest()
+        return f"{DERIVED_CACHE_VERSION}-{digest}"
+
+    def __call__(self, row):
+        player_name = row.player
+
+        # Skip rows without a real player name or NBA team
+        if player_name.isdigit() or row.team not in self.teams:
+            return None
+
+        team = 'PHX' if row.team == 'PHO' else row.team
+        rank = row.rank
+        fg_pct = row.fg_pct
+        fg2_made, fg2_att, fg3_made, fg3_att = row.fg2, row.fg2a, row.fg3, row.fg3a
+
+        # If player has less than 15 games, try to average with previous season totals
+        prev = self.previous(player_name, row.player_id) if row.g < 15 and self.prev_stats else None
+        if prev is not None and prev.g > 0:
+            # Average the raw totals
+            avg_fg2 = (int(round(fg2_made)) + prev.fg2) / 2.0
+            avg_fg2a = (int(round(fg2_att)) + prev.fg2a) / 2.0
+            avg_fg3 = (int(round(fg3_made)) + prev.fg3) / 2.0
+            avg_fg3a = (int(round(fg3_att)) + prev.fg3a) / 2.0
+
+            # Recompute percentages from averaged totals
+            two_pct = (avg_fg2 / avg_fg2a) if avg_fg2a > 0 else 0.0
+            three_pct = (avg_fg3 / avg_fg3a) if avg_fg3a > 0 else 0.0
+            total_made = avg_fg2 + avg_fg3
+            total_att = avg_fg2a + avg_fg3a
+            fg_pct = (total_made / total_att) if total_att > 0 else fg_pct
+
+            # Recompute likelihoods based on averaged made counts
+            made2_likelihood = (avg_fg2 / total_made) * 100.0 if total_made > 0 else 0.0
+
+            if avg_fg2 > avg_fg3:
+                first_made_weighted = 'Made 2 (Avg)'
+            elif avg_fg3 > avg_fg2:
+                first_made_weighted = 'Made 3 (Avg)'
+            else:
+                first_made_weighted = 'Tied (Avg)'
+
+            # Choose the better (lower) ranking between current and previous year
+            prev_rank = prev.rank
+            if isinstance(prev_rank, int) and not (isinstance(rank, int) and rank <= prev_rank):
+                rank = prev_rank
+        else:
+            # Calculate 2P% and 3P% from made/attempts
+            two_pct = (fg2_made / fg2_att) if fg2_att > 0 else 0.0
+            three_pct = (fg3_made / fg3_att) if fg3_att > 0 else 0.0
+            # Calculate weighted first-made based on made counts
+            made_total = fg2_made + fg3_made
+            made2_likelihood = (fg2_made / made_total) * 100.0 if made_total > 0 else 0.0
+
+            if fg2_made > fg3_made:
+                first_made_weighted = 'Made 2'
+            elif fg3_made > fg2_made:
+                first_made_weighted = 'Made 3'
+            else:
+                first_made_weighted = 'Tied'
+
+        # Positional up to made2_likelihood: matching ten keyword arguments
+        # took about a microsecond per row
+        return PlayerStat(
+            player_name,
+            team,
+            rank,
+            row.g,
+            round(fg_pct, 3),
+            round(two_pct, 3),
+            round(three_pct, 3),
+            first_made_weighted,
+            round(made2_likelihood, 1),
+            player_id=row.player_id,
+        )
+
+
+def derive_player_stats(rows, prev_stats, cache=None, name_index=None):
+    """
+    Turn decoded totals rows into PlayerStat records (FG%, 2P%, 3P%, Made 2
+    likelihood, first-made label). Players with fewer than 15 games are
+    averaged with their previous season totals when available.
+    With a DerivedCache, rows whose inputs are unchanged reuse their cached values.
+    `name_index` is an optional stored name index of the previous season(s).
+    """
+    parse = TotalsRowParser(prev_stats, name_index=name_index)
+    # The bound method skips the instance-call dispatch on every row
+    parse_row = parse.__call__
+    players = []
+
+    for row in rows:
+        try:
+            if cache is None:
+                player = parse_row(row)
+            else:
+                key = cache.unplayed_key(row) or parse.row_key(row)
+                if key is None:
                     continue
-                
-                # Helper to safely parse floats at specific indices
-                def parse_at(key):
-                    try:
-                        idx = idx_map_curr.get(key)
-                        if idx is None or idx >= len(cells):
-                            return 0.0
-                        val_str = cells[idx].text.strip()
-                        return float(val_str) if val_str else 0.0
-                    except:
-                        return 0.0
-                
-                # Helper to safely parse integers (for rank)
-                def parse_int_at(key):
-                    try:
-                        idx = idx_map_curr.get(key)
-                        if idx is None or idx >= len(cells):
-                            return None
-                        val_str = cells[idx].text.strip()
-                        return int(val_str) if val_str else None
-                    except:
-                        return None
-                
-                rank = parse_int_at('rank')
-                fg_pct = parse_at('fg_pct')
-                fg2_made = parse_at('fg2')
-                fg2_att = parse_at('fg2a')
-                fg3_made = parse_at('fg3')
-                fg3_att = parse_at('fg3a')
-                current_g = parse_int_at('g') or 0
-
-                # Helper to canonicalize names (remove Jr./Sr. suffixes and dots)
-                def canon_name(n):
-                    if not n:
-                        return n
-                    s = n.replace('.', '').replace(',', '')
-                    tokens = s.split()
-                    # remove common suffixes
-                    suffixes = set(['Jr', 'Sr', 'II', 'III', 'IV'])
-                    if tokens and tokens[-1] in suffixes:
-                        tokens = tokens[:-1]
-                    return ' '.join(tokens)
-
-                used_prev = False
-                # If player has less than 15 games, try to average with previous season totals
-                if current_g < 15 and prev_stats:
-                    prev = prev_stats.get(player_name)
-                    if not prev:
-                        prev = prev_stats.get(canon_name(player_name))
-                    if prev and prev.get('g', 0) > 0:
-                        try:
-                            # convert current to ints where appropriate
-                            c_fg2 = int(round(fg2_made))
-                            c_fg2a = int(round(fg2_att))
-                            c_fg3 = int(round(fg3_made))
-                            c_fg3a = int(round(fg3_att))
-
-                            p_fg2 = int(prev.get('fg2', 0))
-                            p_fg2a = int(prev.get('fg2a', 0))
-                            p_fg3 = int(prev.get('fg3', 0))
-                            p_fg3a = int(prev.get('fg3a', 0))
-
-                            # Average the raw totals
-                            avg_fg2 = (c_fg2 + p_fg2) / 2.0
-                            avg_fg2a = (c_fg2a + p_fg2a) / 2.0
-                            avg_fg3 = (c_fg3 + p_fg3) / 2.0
-                            avg_fg3a = (c_fg3a + p_fg3a) / 2.0
-
-                            # Recompute percentages from averaged totals
-                            two_pct = (avg_fg2 / avg_fg2a) if avg_fg2a > 0 else 0.0
-                            three_pct = (avg_fg3 / avg_fg3a) if avg_fg3a > 0 else 0.0
-                            total_made = avg_fg2 + avg_fg3
-                            total_att = avg_fg2a + avg_fg3a
-                            fg_pct = (total_made / total_att) if total_att > 0 else fg_pct
-
-                            # Recompute likelihoods based on averaged made counts
-                            if total_made > 0:
-                                made2_likelihood = (avg_fg2 / total_made) * 100.0
-                            else:
-                                made2_likelihood = 0.0
-
-                            if avg_fg2 > avg_fg3:
-                                first_made_weighted = 'Made 2 (Avg)'
-                            elif avg_fg3 > avg_fg2:
-                                first_made_weighted = 'Made 3 (Avg)'
-                            else:
-                                first_made_weighted = 'Tied (Avg)'
-
-                            # Choose the better (higher) ranking between current and previous year
-                            try:
-                                prev_rank_val = prev.get('rank') if isinstance(prev.get('rank'), int) else None
-                                cur_rank_val = rank if isinstance(rank, int) else None
-                                if cur_rank_val is None and prev_rank_val is not None:
-                                    rank = prev_rank_val
-                                elif prev_rank_val is None and cur_rank_val is not None:
-                                    rank = cur_rank_val
-                                elif prev_rank_val is not None and cur_rank_val is not None:
-                                    # lower numeric rank is better (1 is best) -> choose min
-                                    rank = min(cur_rank_val, prev_rank_val)
-                            except Exception:
-                                pass
-
-                            used_prev = True
-                        except Exception:
-                            # fallback to current-year calculations if averaging fails
-                            used_prev = False
-
-                if not used_prev:
-                    # Calculate 2P% and 3P% from made/attempts
-                    two_pct = (fg2_made / fg2_att) if fg2_att > 0 else 0.0
-                    three_pct = (fg3_made / fg3_att) if fg3_att > 0 else 0.0
-                    # Calculate weighted first-made based on made counts
-                    made_total = fg2_made + fg3_made
-                    if made_total > 0:
-                        made2_likelihood = (fg2_made / made_total) * 100.0
-                    else:
-                        made2_likelihood = 0.0
+                player = cache.get(key)
+                if player is None:
+                    player = parse_row(row)
+                    if player is not None:
+                        cache.add(key, player)
+        except Exception:
+            continue
+        if player is not None:
+            players.append(player)
 
-                    if fg2_made > fg3_made:
-                        first_made_weighted = 'Made 2'
-                    elif fg3_made > fg2_made:
-                        first_made_weighted = 'Made 3'
-                    else:
-                        first_made_weighted = 'Tied'
-                
-                # end processing for this player
-                
-                players.append({
-                    'Player': player_name,
-                    'Team': team,
-                    'Rank': rank,
-                    'G': current_g,
-                    'FG%': round(fg_pct, 3),
-                    '2P%': round(two_pct, 3),
-                    '3P%': round(three_pct, 3),
-                    'First Made (Weighted)': first_made_weighted,
-                    'Made 2 Likelihood (counts)': round(made2_likelihood, 1),
-                })
-            except Exception as e:
+    return players
+
+
+def save_season(store, season, rows, source=None):
+    """
+    Store rows as a snapshot of `season`, together with the season's name
+    index so later runs can match players without rebuilding it
+    """
+    snapshot_id = store.save_snapshot(season, rows, source=source)
+    store.save_name_index(season, build_name_index(rows))
+    return snapshot_id
+
+
+def stored_name_index(store, season, prior_seasons=1):
+    """
+    Merged name index of the `prior_seasons` seasons before `season`, newest
+    season first (matching prior_totals), or None if any of them is missing
+    """
+    merged = {}
+    for prior in range(season - 1, season - prior_seasons - 1, -1):
+        try:
+            index = store.load_name_index(prior)
+        except Exception:
+            index = None
+        if index is None:
+            return None
+        for name, key in index.items():
+            merged.setdefault(name, key)
+    return merged
+
+
+def record_snapshot(store, totals, season=CURRENT_SEASON):
+    """
+    Save scraped (rows, prev_stats) to the stats store as a snapshot of
+    `season` and print what changed since the previous snapshot. Nothing is
+    stored when the rows are unchanged; the previous snapshot is only marked
+    as checked (plan_refresh counts that as fresh). Last season's totals are
+    likewise only stored again when they differ.
+    Returns the diff (see stats_store.diff_rows), or None for a first snapshot
+    """
+    rows, prev_stats = totals
+    try:
+        last_id = store.latest_snapshot(season)
+        diff = diff_rows(store.load_rows(last_id), rows) if last_id else None
+        if diff is not None and not any(diff.values()):
+            store.mark_checked(last_id)
+        else:
+            save_season(store, season, rows, source='scrape')
+
+        if prev_stats:
+            prev_rows = list(prev_stats.values())
+            prev_id = store.latest_snapshot(season - 1)
+            if prev_id is None or any(diff_rows(store.load_rows(prev_id), prev_rows).values()):
+                save_season(store, season - 1, prev_rows, source='scrape')
+    except Exception as e:
+        print(f"Could not save stats snapshot: {str(e)[:150]}")
+        return None
+
+    if diff is None:
+        print(f"Saved first {season} snapshot ({len(rows)} rows)")
+    elif not any(diff.values()):
+        print("No changes since last snapshot, nothing saved")
+    else:
+        print(f"Since last snapshot: {len(diff['changed'])} changed, "
+              f"{len(diff['added'])} added, {len(diff['removed'])} removed")
+    return diff
+
+
+def load_snapshot_totals(store, as_of=None, season=CURRENT_SEASON, prior_seasons=1):
+    """
+    (rows, prev_stats) from the newest stored snapshots on or before `as_of`
+    (YYYY-MM-DD; default latest), the stored counterpart of scrape_totals().
+    prev_stats draws on up to `prior_seasons` earlier seasons (see prior_totals).
+    Returns None if the store has no snapshot of `season` by then
+    """
+    snapshot_id = store.latest_snapshot(season, as_of)
+    if snapshot_id is None:
+        print(f"No stored {season} snapshot{f' on or before {as_of}' if as_of else ''}")
+        return None
+    return store.load_rows(snapshot_id), prior_totals(store, season, prior_seasons, as_of=as_of)
+
+
+def prior_totals(store, season, prior_seasons, prev_stats=None, as_of=None):
+    """
+    player_name -> TotalsRow from the `prior_seasons` seasons before `season`,
+    taking each player's most recent season, so a player who missed last
+    season still blends with the one before. `prev_stats` (last season's
+    scraped lookup) is used as-is instead of the stored copy when given.
+    """
+    merged = dict(prev_stats) if prev_stats is not None else {}
+    first = season - 1 if prev_stats is None else season - 2
+    for prior in range(first, season - prior_seasons - 1, -1):
+        # Last row per player within a season wins, as in scrape_totals()
+        for name, row in {r.player: r for r in store.season_rows(prior, as_of)}.items():
+            merged.setdefault(name, row)
+    return merged
+
+
+def backfill_seasons(store, first, last, base_url=BBREF_BASE_URL, max_workers=4,
+                     min_interval=BACKFILL_REQUEST_INTERVAL):
+    """
+    Fetch the totals pages of seasons first..last (inclusive) in parallel,
+    rate-limited per host and through the page cache, and store each as a
+    snapshot. Seasons whose stored rows are already identical are skipped.
+    Returns the number of seasons stored.
+    """
+    urls = {season: season_totals_url(season, base_url) for season in range(first, last + 1)}
+    print(f"Backfilling {len(urls)} seasons ({first}-{last})...")
+    pages = fetch_pages(urls.values(), max_workers=max_workers, min_interval=min_interval)
+
+    stored = 0
+    for season, url in urls.items():
+        try:
+            html = pages.get(url)
+            rows = decode_table(html, 'totals_stats', TotalsRow, TOTALS_STATS) if html else None
+            if not rows:
+                print(f"{season}: no totals table, skipped")
                 continue
-        
-        driver.quit()
+            last_id = store.latest_snapshot(season)
+            if last_id is not None and not any(diff_rows(store.load_rows(last_id), rows).values()):
+                print(f"{season}: already stored ({len(rows)} rows)")
+                continue
+            save_season(store, season, rows, source='backfill')
+            stored += 1
+            print(f"{season}: stored {len(rows)} rows")
+        except Exception as e:
+            print(f"{season}: backfill failed: {str(e)[:150]}")
+
+    print(f"Backfill done: {stored} of {len(urls)} seasons stored")
+    return stored
+
+
+def load_derived_cache(store, played_teams=None, diff=None):
+    """
+    DerivedCache seeded with the derived rows saved in the stats store.
+    `diff` is record_snapshot()'s diff against the last snapshot; without
+    it every row is matched by row_key()
+    """
+    changed = set(diff['changed']).union(diff['added']) if diff is not None else None
+    try:
+        return DerivedCache(store.load_derived(), played_teams, changed)
+    except Exception as e:
+        print(f"Could not load derived rows: {str(e)[:150]}")
+        return DerivedCache(played_teams=played_teams, changed=changed)
+
+
+class RefreshPlan(NamedTuple):
+    scrape: bool
+    # basketball-reference codes of teams with a game final since the last
+    # snapshot (None: unknown, treat every team as changed)
+    played_teams: Optional[frozenset]
+    # When the next unfinished game of the day should be in the totals
+    next_final: Optional[datetime]
+
+
+def plan_refresh(store, season=CURRENT_SEASON, espn_base=None, now=None):
+    """
+    Decide from the ESPN scoreboard whether a scrape can change anything:
+    only games that went final since the newest stored snapshot was taken
+    or last found unchanged, and have had GAME_SETTLE_TIME for
+    basketball-reference to catch up, do.
+    Without a snapshot, or if the scoreboard can't be fetched, plans a full scrape.
+    `espn_base` points schedule.py at another ESPN host (e.g. a local stub).
+    """
+    now = now or datetime.now(timezone.utc)
+    try:
+        snapshots = store.snapshots(season)
+        if not snapshots:
+            return RefreshPlan(True, None, None)
+        last = datetime.fromisoformat(snapshots[-1]['checked_at'] or snapshots[-1]['taken_at'])
+        first_day = (last - GAME_SETTLE_TIME).astimezone(ET).date()
+        days = (now.astimezone(ET).date() - first_day).days + 1
+        games = fetch_week(['nba'], days, start=first_day, base_url=espn_base, strict=True)
+    except Exception as e:
+        print(f"Could not check the NBA schedule, refreshing anyway: {str(e)[:150]}")
+        return RefreshPlan(True, None, None)
+
+    played, next_final = set(), None
+    for game in games:
+        try:
+            settled = datetime.fromisoformat(game['start'].replace('Z', '+00:00')) + GAME_SETTLE_TIME
+        except ValueError:
+            continue
+        if settled <= now:
+            if game['state'] == 'post' and settled > last:
+                played.update(ESPN_TEAM_CODES.get(t, t) for t in (game['away'], game['home']))
+        # Not settled yet, final or not: the next time a scrape can change anything
+        elif next_final is None or settled < next_final:
+            next_final = settled
+
+    return RefreshPlan(bool(played), frozenset(played) or None, next_final)
+
+
+def players_from_totals(totals, as_frame=False, cache=None, name_index=None):
+    """
+    Derive PlayerStat records (a DataFrame if as_frame=True) from
+    (rows, prev_stats); None if too few players came out
+    `cache` is an optional DerivedCache of the previous run's rows and
+    `name_index` the stored name index of the previous season(s)
+    """
+    try:
+        derive = derive_player_stats_frame if as_frame else derive_player_stats
+        players = derive(*totals, cache=cache, name_index=name_index)
         
         if len(players) > 100:
             print(f"✅ Successfully scraped {len(players)} live NBA players!")
@@ -548,15 +1253,62 @@ def scrape_nba_stats():
             return None
             
     except Exception as e:
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass
         print(f"Scraping failed: {str(e)[:150]}")
         return None
 
 
+def scrape_nba_stats(base_url=BBREF_BASE_URL, pages=None, as_frame=False, store=None, prior_seasons=1,
+                     played_teams=None):
+    """
+    Scrape NBA player FG% data from basketball-reference.com
+    (plain HTTP, with Selenium as a fallback)
+    Returns a list of PlayerStat records including FG%, 2P%, 3P%
+    (a DataFrame with the same columns if as_frame=True)
+    `pages` is an optional {url: html} dict from fetch_pages(); when omitted
+    the current and previous season pages are fetched concurrently
+    With a StatsStore the scraped totals are also saved as a dated snapshot,
+    and only rows that changed since the last run are recomputed;
+    prior_seasons > 1 lets low-games players blend with older stored seasons.
+    `played_teams` (from plan_refresh) limits recomputation to those teams'
+    rows, combined 2TM/3TM rows and rows that changed since the last snapshot
+    """
+    print("Scraping NBA player stats from basketball-reference.com...")
+    
+    totals = scrape_totals(base_url, pages)
+    if totals is None:
+        return None
+    
+    if store is None:
+        return players_from_totals(totals, as_frame)
+    
+    # A read-only store (--no-store) still supplies older seasons but isn't written
+    diff = record_snapshot(store, totals) if not store.read_only else None
+    if prior_seasons > 1:
+        rows, prev_stats = totals
+        totals = rows, prior_totals(store, CURRENT_SEASON, prior_seasons, prev_stats)
+    cache = load_derived_cache(store, played_teams, diff)
+    name_index = stored_name_index(store, CURRENT_SEASON, prior_seasons)
+    players = players_from_totals(totals, as_frame, cache, name_index)
+    print(f"Recomputed {cache.misses} of {cache.hits + cache.misses} rows "
+          f"({cache.hits} unchanged since the last run)")
+    if players is not None and not store.read_only:
+        try:
+            store.save_derived(cache.used)
+        except Exception as e:
+            print(f"Could not save derived rows: {str(e)[:150]}")
+    return players
+
+
+def scrape_all_stats(base_url=BBREF_BASE_URL):
+    """
+    Fetch the current totals, previous totals and shooting pages in parallel
+    and scrape both the FG% and dunk stats from them
+    Returns (players, dunk_players); either may be None on failure
+    """
+    pages = fetch_pages(season_page_urls(base_url, include_shooting=True).values())
+    return scrape_nba_stats(base_url, pages=pages), scrape_dunk_stats(base_url, pages=pages)
+
+
 def create_sample_data():
     """
     Create comprehensive sample data with all 30 NBA teams and realistic rosters
@@ -721,7 +1473,7 @@ def add_team_rankings(players_data):
     # Group players by team
     teams = {}
     for player in players_data:
-        team = player['Team']
+        team = player.team
         if team not in teams:
             teams[team] = []
         teams[team].append(player)
@@ -729,10 +1481,10 @@ def add_team_rankings(players_data):
     # Rank within each team by FG%
     for team, team_players in teams.items():
         # Sort by FG% descending
-        sorted_team = sorted(team_players, key=lambda x: x['FG%'], reverse=True)
+        sorted_team = sorted(team_players, key=lambda x: x.fg_pct, reverse=True)
         for rank, player in enumerate(sorted_team, 1):
-            player['Team Rank'] = rank
-            player['Team Total Players'] = len(sorted_team)
+            player.team_rank = rank
+            player.team_total = len(sorted_team)
     
     return players_data
 
@@ -744,41 +1496,188 @@ def add_first_made_calculation(players_data):
     """
     for player in players_data:
         # If already has First Made field, skip
-        if 'First Made' in player:
+        if player.first_made is not None:
             continue
         
-        two_pct = player.get('2P%', 0)
-        three_pct = player.get('3P%', 0)
+        two_pct = player.two_pct or 0
+        three_pct = player.three_pct or 0
         
         if two_pct > three_pct:
-            player['First Made'] = 'Made 2'
+            player.first_made = 'Made 2'
         elif three_pct > two_pct:
-            player['First Made'] = 'Made 3'
+            player.first_made = 'Made 3'
         else:
-            player['First Made'] = 'Tied'
+            player.first_made = 'Tied'
     
     return players_data
 
 
+# How each display key is sent to the page (see encode_player_columns):
+# 'text' as is, 'dict' as indexes into a table of its distinct strings,
+# 'int' as is, and a number as fixed-point integers of value * that scale
+# (the precision TotalsRowParser rounds to)
+COLUMN_ENCODINGS = {
+    'Player': 'text',
+    'Team': 'dict',
+    'Rank': 'int',
+    'G': 'int',
+    'FG%': 1000,
+    '2P%': 1000,
+    '3P%': 1000,
+    'First Made (Weighted)': 'dict',
+    'Made 2 Likelihood (counts)': 10,
+    'First Made': 'dict',
+    'Team Rank': 'int',
+    'Team Total Players': 'int',
+}
+
+
+def encode_player_columns(players):
+    """
+    Columnar form of a list of display dicts, decoded by the page's
+    decodePlayers(): {'n': row count, 'cols': {key: column}}, where a
+    column is {'v': values} plus 'dict' (string table) or 'scale' (fixed
+    point) as set in COLUMN_ENCODINGS. Missing values are null. A column
+    that does not survive its encoding exactly is sent as plain values.
+    """
+    cols = {}
+    for key, encoding in COLUMN_ENCODINGS.items():
+        values = [p.get(key) for p in players]
+        present = [v for v in values if v is not None]
+        if not present:
+            continue
+        if encoding == 'dict' and all(isinstance(v, str) for v in present):
+            table = list(dict.fromkeys(present))
+            codes = {v: i for i, v in enumerate(table)}
+            cols[key] = {'dict': table, 'v': [None if v is None else codes[v] for v in values]}
+        elif isinstance(encoding, int) and all(isinstance(v, (int, float)) for v in present):
+            fixed = [None if v is None else int(round(v * encoding)) for v in values]
+            if all(f is None or f / encoding == v for f, v in zip(fixed, values)):
+                cols[key] = {'scale': encoding, 'v': fixed}
+            else:
+                cols[key] = {'v': values}
+        else:
+            cols[key] = {'v': values}
+    return {'n': len(players), 'cols': cols}
+
+
+SEARCH_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def search_tokens(name):
+    """
+    Words of a player name as the page's search matches them: accents
+    folded, lower case, split on anything but letters and digits
+    (the page folds the query the same way)
+    """
+    folded = ''.join(c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c))
+    return SEARCH_TOKEN_RE.findall(folded.lower())
+
+
+def build_search_index(players, rank_order=None):
+    """
+    Search index over display dicts, by row position:
+    {'tokens': sorted name words, 'rows': row ids per word, 'teams': {team: row ids}}.
+    Team row ids follow `rank_order` (all row ids by rank) when given.
+    The page finds a query word's matches by binary-searching `tokens` for
+    the words it prefixes, and a team's rows in `teams`, without scanning
+    every row
+    """
+    by_token, teams = {}, {}
+    for i, p in enumerate(players):
+        for token in dict.fromkeys(search_tokens(p.get('Player') or '')):
+            by_token.setdefault(token, []).append(i)
+    for i in rank_order if rank_order is not None else range(len(players)):
+        teams.setdefault((players[i].get('Team') or '').upper(), []).append(i)
+    tokens = sorted(by_token)
+    return {'tokens': tokens, 'rows': [by_token[t] for t in tokens], 'teams': teams}
+
+
+# Sortable columns, in table header order
+SORT_KEYS = ['Rank', 'Player', 'Team', 'FG%', '2P%', '3P%', 'Made 2 Likelihood (counts)', 'First Made (Weighted)']
+# Numeric columns whose sorted order ships with the data (the default order
+# and the headline stat); the page sorts the others on their first click
+SHIPPED_SORT_KEYS = ['Rank', 'FG%']
+
+
+def column_order(players, key):
+    """
+    Row ids in ascending order of a numeric column, missing values last and
+    ties in row order (as the page's sortOrder() sorts it)
+    """
+    values = [p.get(key) for p in players]
+    return sorted(range(len(players)), key=lambda i: (values[i] is None, values[i] or 0))
+
+
+def encode_order(order):
+    """
+    A permutation of row ids for the page: {'runs': [first id, length, ...]}
+    of its runs of consecutive ids when that is shorter (rows mostly arrive
+    in rank order), else {'ids': order}. Decoded by the page's decodeOrder()
+    """
+    runs = []
+    for i, row_id in enumerate(order):
+        if i and row_id == order[i - 1] + 1:
+            runs[-1] += 1
+        else:
+            runs += [row_id, 1]
+    return {'runs': runs} if len(runs) < len(order) else {'ids': order}
+
+
+def players_payload(players_data):
+    """
+    What the page shows: {'updated': date label, 'players': encode_player_columns(),
+    'search': build_search_index(), 'order': {key: encode_order()} for SHIPPED_SORT_KEYS}
+    `players_data` is a list of PlayerStat records (display dicts are accepted too)
+    """
+    players = [p.to_display_dict() if isinstance(p, PlayerStat) else p for p in players_data]
+    orders = {key: column_order(players, key) for key in SHIPPED_SORT_KEYS}
+    return {
+        'updated': datetime.now().strftime("%B %d, %Y"),
+        'players': encode_player_columns(players),
+        'search': build_search_index(players, orders['Rank']),
+        'order': {key: encode_order(order) for key, order in orders.items()},
+    }
+
+
 def create_interactive_html(players_data):
     """
-    Create an interactive HTML table with team filtering
+    Create an interactive HTML table with team filtering, with the player
+    data inlined into the page
+    `players_data` is a list of PlayerStat records (display dicts are accepted too)
+    """
+    payload = players_payload(players_data)
+    data = json.dumps(payload, separators=(',', ':'))
+    return interactive_page(f"const loadPlayers = () => Promise.resolve({data});",
+                            payload['updated'])
+
+
+def create_html_shell(manifest_url=f"{DATA_DIR_NAME}/{DATA_MANIFEST_NAME}"):
+    """
+    The interactive page without data: it reads the data file named in the
+    manifest at `manifest_url` (see save_split_html). The shell only changes
+    when this template does, so browsers can keep it cached.
+    """
+    data_dir = manifest_url.rsplit('/', 1)[0] + '/' if '/' in manifest_url else ''
+    loader = f"""async function loadPlayers() {{
+            const manifest = await (await fetch('{manifest_url}', {{cache: 'no-cache'}})).json();
+            return (await fetch('{data_dir}' + manifest.data)).json();
+        }}"""
+    return interactive_page(loader)
+
+
+def interactive_page(data_loader, updated=''):
+    """
+    HTML of the interactive table. `data_loader` is JavaScript defining
+    loadPlayers(), a promise of players_payload(); `updated` is the date
+    label rendered before the data arrives
     """
-    # Get current date for last updated
-    from datetime import datetime
-    current_date = datetime.now().strftime("%B %d, %Y")
-    
     # All 30 NBA teams - include all in dropdown even if some have no players
     all_nba_teams = ['ATL', 'BOS', 'BRK', 'CHO', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW', 'HOU', 'IND', 'LAC', 'LAL', 
                      'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHX', 'POR', 'SAC', 'SAS', 
                      'TOR', 'UTA', 'WAS']
-    teams_in_data = set(p['Team'] for p in players_data)
-    # Use all NBA teams for dropdown, but keep teams_in_data for reference
     teams = sorted(all_nba_teams)
     
-    # Convert data to JSON
-    players_json = json.dumps(players_data)
-    
     html_content = f"""
 <!DOCTYPE html>
 <html lang="en">
@@ -894,7 +1793,8 @@ def create_interactive_html(players_data):
         }}
         
         .table-wrapper {{
-            overflow-x: auto;
+            overflow: auto;
+            max-height: 70vh;
             border-radius: 5px;
             border: 1px solid #ddd;
         }}
@@ -930,18 +1830,31 @@ def create_interactive_html(players_data):
             border-bottom: 1px solid #eee;
         }}
         
-        tbody tr {{
-            transition: background-color 0.2s;
+        tbody tr {{
+            transition: background-color 0.2s;
+        }}
+        
+        tbody tr.player-row {{
+            height: 44px;
+        }}
+        
+        tbody tr.player-row td {{
+            white-space: nowrap;
         }}
         
         tbody tr:hover {{
             background-color: #f8f9ff;
         }}
         
-        tbody tr:nth-child(even) {{
+        tbody tr.even {{
             background-color: #f9f9f9;
         }}
         
+        tbody tr.spacer td {{
+            padding: 0;
+            border: 0;
+        }}
+        
         .stat {{
             font-weight: 500;
             color: #1e3c72;
@@ -983,7 +1896,7 @@ def create_interactive_html(players_data):
 <body>
     <div class="container">
         <h1>🏀 NBA Player Field Goal Percentage Stats</h1>
-        <p class="subtitle">2024-2026 Season(s) | Interactive Filtering by Team | Last Updated (Including Trades): {current_date}</p>
+        <p class="subtitle">2024-2026 Season(s) | Interactive Filtering by Team | Last Updated (Including Trades): <span id="lastUpdated">{updated}</span></p>
         
         <div class="controls">
             <label for="teamFilter">Filter by Team:</label>
@@ -993,13 +1906,13 @@ def create_interactive_html(players_data):
             </select>
             
             <div class="search-box">
-                <input type="text" id="playerSearch" placeholder="Search player name..." onkeyup="filterTable()">
+                <input type="text" id="playerSearch" placeholder="Search player name..." oninput="scheduleFilter()">
             </div>
             
             <button onclick="resetFilters()">Reset Filters</button>
         </div>
         
-        <div class="table-wrapper">
+        <div class="table-wrapper" id="tableWrapper">
             <table id="statsTable">
                 <thead>
                     <tr>
@@ -1023,106 +1936,350 @@ def create_interactive_html(players_data):
     
     <script>
         // Data from Python
-        const allPlayers = {players_json};
-        let currentData = [...allPlayers];
+        {data_loader}
+        let allPlayers = [];
+        let currentIds = [];
+        let sortOrders = {{}};
+        const SORT_KEYS = {json.dumps(SORT_KEYS)};
         let sortAscending = {{}};
         
-        // Populate table
-        function populateTable(data) {{
+        // Rebuild player objects from the columnar payload (encode_player_columns)
+        function decodePlayers(encoded) {{
+            const players = Array.from({{length: encoded.n}}, () => ({{}}));
+            for (const [key, col] of Object.entries(encoded.cols)) {{
+                const v = col.v;
+                for (let i = 0; i < encoded.n; i++) {{
+                    if (v[i] === null) continue;
+                    players[i][key] = col.dict ? col.dict[v[i]] : col.scale ? v[i] / col.scale : v[i];
+                }}
+            }}
+            return players;
+        }}
+        
+        // Virtual scrolling: only the rows in view (plus OVERSCAN on each
+        // side) are in the DOM, between two spacer rows that stand in for the
+        // rest; the row elements are reused as the table scrolls
+        const ROW_HEIGHT = 44;
+        const OVERSCAN = 10;
+        let rowHeight = ROW_HEIGHT;
+        let rowMeasured = false;
+        let viewRows = [];
+        let rowPool = [];
+        let topSpacer, bottomSpacer, emptyRow;
+        let renderQueued = false;
+        
+        function spacerRow(className) {{
+            const row = document.createElement('tr');
+            row.className = className;
+            const cell = document.createElement('td');
+            cell.colSpan = 8;
+            row.appendChild(cell);
+            return row;
+        }}
+        
+        function initTable() {{
+            const tbody = document.getElementById('tableBody');
+            topSpacer = spacerRow('spacer');
+            emptyRow = spacerRow('empty');
+            emptyRow.firstChild.className = 'info';
+            emptyRow.firstChild.textContent = 'No players found matching your filters.';
+            emptyRow.style.display = 'none';
+            bottomSpacer = spacerRow('spacer');
+            tbody.appendChild(topSpacer);
+            tbody.appendChild(emptyRow);
+            tbody.appendChild(bottomSpacer);
+            
+            const wrapper = document.getElementById('tableWrapper');
+            wrapper.addEventListener('scroll', scheduleRender);
+            window.addEventListener('resize', () => {{
+                rowMeasured = false;
+                scheduleRender();
+            }});
+        }}
+        
+        function scheduleRender() {{
+            if (renderQueued) return;
+            renderQueued = true;
+            requestAnimationFrame(() => {{
+                renderQueued = false;
+                renderWindow();
+            }});
+        }}
+        
+        // A row element with its cells; cell text goes in row.slots
+        function createRow() {{
+            const row = document.createElement('tr');
+            row.slots = [];
+            for (let c = 0; c < 8; c++) {{
+                const td = document.createElement('td');
+                let slot = td;
+                if (c === 2) {{
+                    slot = document.createElement('span');
+                    slot.className = 'stat-badge';
+                    td.appendChild(slot);
+                }} else if (c === 0 || c === 1 || c === 6 || c === 7) {{
+                    slot = document.createElement('strong');
+                    td.appendChild(slot);
+                }}
+                row.appendChild(td);
+                row.slots.push(slot);
+            }}
+            row.fgCell = row.slots[3];
+            return row;
+        }}
+        
+        function fillRow(row, player, index) {{
+            const rank = player['Rank'] !== undefined ? player['Rank'] : 'N/A';
+            const fgPercent = (player['FG%'] * 100).toFixed(1);
+            const twoPercent = (player['2P%'] * 100).toFixed(1);
+            const threePercent = (player['3P%'] * 100).toFixed(1);
+            const made2Likelihood = player['Made 2 Likelihood (counts)'] !== undefined ? player['Made 2 Likelihood (counts)'].toFixed(1) : '0.0';
+            const firstMadeWeighted = player['First Made (Weighted)'] || player['First Made'] || 'Unknown';
+            
+            // Determine color coding
+            let fgClass = 'stat';
+            if (player['FG%'] >= 0.50) fgClass += ' high-stat';
+            else if (player['FG%'] < 0.40) fgClass += ' low-stat';
+            else fgClass += ' medium-stat';
+            
+            const slots = row.slots;
+            slots[0].textContent = rank;
+            slots[1].textContent = player.Player;
+            slots[2].textContent = player.Team;
+            slots[3].textContent = `${{fgPercent}}%`;
+            slots[4].textContent = `${{twoPercent}}%`;
+            slots[5].textContent = `${{threePercent}}%`;
+            slots[6].textContent = `${{made2Likelihood}}%`;
+            slots[7].textContent = firstMadeWeighted;
+            row.fgCell.className = fgClass;
+            row.className = index % 2 ? 'player-row even' : 'player-row';
+            row.style.display = '';
+        }}
+        
+        // Render the rows currently scrolled into view
+        function renderWindow() {{
+            const wrapper = document.getElementById('tableWrapper');
             const tbody = document.getElementById('tableBody');
-            tbody.innerHTML = '';
+            const total = viewRows.length;
+            const visible = Math.ceil((wrapper.clientHeight || 800) / rowHeight) + 2 * OVERSCAN;
+            const start = Math.max(0, Math.min(Math.floor(wrapper.scrollTop / rowHeight) - OVERSCAN, total - visible));
+            const end = Math.min(total, start + visible);
+            
+            while (rowPool.length < end - start) {{
+                const row = createRow();
+                tbody.insertBefore(row, bottomSpacer);
+                rowPool.push(row);
+            }}
+            for (let i = 0; i < rowPool.length; i++) {{
+                if (start + i < end) fillRow(rowPool[i], viewRows[start + i], start + i);
+                else rowPool[i].style.display = 'none';
+            }}
+            topSpacer.style.height = `${{start * rowHeight}}px`;
+            bottomSpacer.style.height = `${{(total - end) * rowHeight}}px`;
+            
+            // Measure the real row height once the first row is laid out
+            // (and again after a resize); the next frame picks it up
+            if (!rowMeasured && end > start) {{
+                rowMeasured = true;
+                const measured = rowPool[0].offsetHeight;
+                if (measured && measured !== rowHeight) {{
+                    rowHeight = measured;
+                    scheduleRender();
+                }}
+            }}
+        }}
+        
+        // Show `data` in the table, scrolled to the top
+        function populateTable(data) {{
+            viewRows = data;
+            document.getElementById('tableWrapper').scrollTop = 0;
+            emptyRow.style.display = data.length === 0 ? '' : 'none';
+            renderWindow();
             
             if (data.length === 0) {{
-                tbody.innerHTML = '<tr><td colspan="8" class="info">No players found matching your filters.</td></tr>';
                 document.getElementById('resultInfo').textContent = 'No results found.';
                 return;
             }}
-            
-            data.forEach(player => {{
-                const row = document.createElement('tr');
-                const rank = player['Rank'] !== undefined ? player['Rank'] : 'N/A';
-                const fgPercent = (player['FG%'] * 100).toFixed(1);
-                const twoPercent = (player['2P%'] * 100).toFixed(1);
-                const threePercent = (player['3P%'] * 100).toFixed(1);
-                const made2Likelihood = player['Made 2 Likelihood (counts)'] !== undefined ? player['Made 2 Likelihood (counts)'].toFixed(1) : '0.0';
-                const firstMadeWeighted = player['First Made (Weighted)'] || player['First Made'] || 'Unknown';
-                
-                // Determine color coding
-                let fgClass = 'stat';
-                if (player['FG%'] >= 0.50) fgClass += ' high-stat';
-                else if (player['FG%'] < 0.40) fgClass += ' low-stat';
-                else fgClass += ' medium-stat';
-                
-                row.innerHTML = `
-                    <td><strong>${{rank}}</strong></td>
-                    <td><strong>${{player.Player}}</strong></td>
-                    <td><span class="stat-badge">${{player.Team}}</span></td>
-                    <td class="${{fgClass}}">${{fgPercent}}%</td>
-                    <td>${{twoPercent}}%</td>
-                    <td>${{threePercent}}%</td>
-                    <td><strong>${{made2Likelihood}}%</strong></td>
-                    <td><strong>${{firstMadeWeighted}}</strong></td>
-                `;
-                tbody.appendChild(row);
-            }});
-            
             document.getElementById('resultInfo').textContent = `Showing ${{data.length}} of ${{allPlayers.length}} players`;
         }}
         
+        // Search index from Python (build_search_index); row ids index allPlayers
+        let searchIndex = {{tokens: [], rows: [], teams: {{}}}};
+        const SEARCH_DELAY = 150;
+        let filterTimer = null;
+        // Scan instead of merging id lists once the narrowest word matches
+        // more than 1 / SCAN_RATIO of the rows
+        const SCAN_RATIO = 8;
+        let scanNames = null;
+        
+        // Query words, folded like search_tokens() in Python
+        function searchTokens(text) {{
+            // Only non-ASCII text has accents to strip
+            const folded = /^[\\x00-\\x7f]*$/.test(text) ? text : text.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '');
+            return folded.toLowerCase().match(/[a-z0-9]+/g) || [];
+        }}
+        
+        // Row id lists of the name words starting with `prefix`
+        function prefixLists(prefix) {{
+            const tokens = searchIndex.tokens;
+            let lo = 0, hi = tokens.length;
+            while (lo < hi) {{
+                const mid = (lo + hi) >> 1;
+                if (tokens[mid] < prefix) lo = mid + 1;
+                else hi = mid;
+            }}
+            const lists = [];
+            for (let k = lo; k < tokens.length && tokens[k].startsWith(prefix); k++) {{
+                lists.push(searchIndex.rows[k]);
+            }}
+            return lists;
+        }}
+        
+        // Each row's folded name words as ' word word', built on first use
+        function searchNames() {{
+            if (scanNames === null) scanNames = allPlayers.map(p => ' ' + searchTokens(p.Player).join(' '));
+            return scanNames;
+        }}
+        
+        // Row ids matching the team and every query word: a team's rows in
+        // rank order, otherwise ascending; null means all rows
+        function matchingRows(team, query) {{
+            let ids = team === '' ? null : (searchIndex.teams[team] || []);
+            // Narrowest word first, so the others only filter a short list
+            const words = searchTokens(query).map(word => {{
+                const lists = prefixLists(word);
+                return {{word, lists, size: lists.reduce((n, l) => n + l.length, 0)}};
+            }}).sort((a, b) => a.size - b.size);
+            if (words.length > 0 && words[0].size * SCAN_RATIO > allPlayers.length) {{
+                // Every word matches a large share of the rows: one pass over
+                // the names is cheaper than marking and merging the id lists
+                const names = searchNames();
+                const needles = words.map(({{word}}) => ' ' + word);
+                const count = ids === null ? names.length : ids.length;
+                const matched = [];
+                next: for (let k = 0; k < count; k++) {{
+                    const id = ids === null ? k : ids[k];
+                    for (const needle of needles) if (!names[id].includes(needle)) continue next;
+                    matched.push(id);
+                }}
+                return matched;
+            }}
+            for (const {{word, lists, size}} of words) {{
+                if (ids !== null && ids.length * 32 < size) {{
+                    // Far fewer candidates than hits: check the candidates' own words
+                    ids = ids.filter(id => searchTokens(allPlayers[id].Player).some(t => t.startsWith(word)));
+                    continue;
+                }}
+                const hits = new Uint8Array(allPlayers.length);
+                for (const list of lists) for (let k = 0; k < list.length; k++) hits[list[k]] = 1;
+                if (ids !== null) {{
+                    ids = ids.filter(id => hits[id]);
+                }} else if (size * 16 < allPlayers.length) {{
+                    ids = Array.from(new Int32Array(lists.flat()).sort()).filter((id, k, a) => k === 0 || id !== a[k - 1]);
+                }} else {{
+                    ids = [];
+                    for (let id = 0; id < hits.length; id++) if (hits[id]) ids.push(id);
+                }}
+            }}
+            return ids;
+        }}
+        
+        // Typing filters once the input pauses
+        function scheduleFilter() {{
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(filterTable, SEARCH_DELAY);
+        }}
+        
         // Filter table by team and player name
         function filterTable() {{
+            clearTimeout(filterTimer);
             const teamFilter = document.getElementById('teamFilter').value.toUpperCase();
-            const playerSearch = document.getElementById('playerSearch').value.toLowerCase();
-            
-            currentData = allPlayers.filter(player => {{
-                const teamMatch = teamFilter === '' || player.Team.toUpperCase() === teamFilter;
-                const playerMatch = player.Player.toLowerCase().includes(playerSearch);
-                return teamMatch && playerMatch;
-            }});
-            
-            // When filtering by team, sort by rank ascending (best rank first)
-            if (teamFilter !== '') {{
-                currentData.sort((a, b) => a['Rank'] - b['Rank']);
-            }}
+            const playerSearch = document.getElementById('playerSearch').value;
             
-            populateTable(currentData);
+            // Team buckets come sorted by rank ascending (best rank first)
+            const ids = matchingRows(teamFilter, playerSearch);
+            showRows(ids === null ? allRows() : ids);
         }}
         
         // Reset filters
         function resetFilters() {{
             document.getElementById('teamFilter').value = '';
             document.getElementById('playerSearch').value = '';
-            currentData = [...allPlayers];
-            populateTable(currentData);
+            showRows(allRows());
+        }}
+        
+        function allRows() {{
+            return allPlayers.map((_, id) => id);
+        }}
+        
+        function showRows(ids) {{
+            currentIds = ids;
+            populateTable(ids.map(id => allPlayers[id]));
+        }}
+        
+        // A permutation shipped by Python (encode_order)
+        function decodeOrder(order) {{
+            if (order.ids) return order.ids;
+            const ids = [];
+            for (let i = 0; i < order.runs.length; i += 2) {{
+                for (let id = order.runs[i], end = id + order.runs[i + 1]; id < end; id++) ids.push(id);
+            }}
+            return ids;
+        }}
+        
+        // Row ids in ascending order of a column (missing values last, ties
+        // in row order): shipped with the data for SHIPPED_SORT_KEYS, else
+        // sorted on the first click on that column and kept
+        const collator = new Intl.Collator();
+        function sortOrder(key) {{
+            if (!(key in sortOrders)) {{
+                const values = allPlayers.map(p => p[key]);
+                const numeric = values.every(v => v === undefined || typeof v === 'number');
+                const compare = numeric ? (x, y) => x - y : (x, y) => collator.compare(x, y);
+                sortOrders[key] = allRows().sort((a, b) => {{
+                    const x = values[a], y = values[b];
+                    if (x === undefined || y === undefined) return (x === undefined) - (y === undefined) || a - b;
+                    return compare(x, y) || a - b;
+                }});
+            }}
+            return sortOrders[key];
+        }}
+        
+        // `ids` in the order of `order` (a sorted permutation of all row ids)
+        function inOrder(order, ids) {{
+            const shown = new Uint8Array(allPlayers.length);
+            for (const id of ids) shown[id] = 1;
+            return order.filter(id => shown[id]);
         }}
         
-        // Sort table by column
+        // Sort table by column: later clicks on a column reuse its sorted order
         function sortTable(columnIndex) {{
-            const headers = ['Rank', 'Player', 'Team', 'FG%', '2P%', '3P%', 'Made 2 Likelihood (counts)', 'First Made (Weighted)'];
-            const sortKey = headers[columnIndex];
+            const sortKey = SORT_KEYS[columnIndex];
             const isAscending = sortAscending[columnIndex] || false;
             
-            currentData.sort((a, b) => {{
-                let aVal = a[sortKey];
-                let bVal = b[sortKey];
-                
-                // Handle numeric sorting
-                if (typeof aVal === 'number') {{
-                    return isAscending ? aVal - bVal : bVal - aVal;
-                }}
-                
-                // Handle string sorting
-                const comparison = aVal.localeCompare(bVal);
-                return isAscending ? comparison : -comparison;
-            }});
+            const ids = inOrder(sortOrder(sortKey), currentIds);
+            if (!isAscending) ids.reverse();
             
             sortAscending[columnIndex] = !isAscending;
-            populateTable(currentData);
+            showRows(ids);
         }}
         
         // Initialize table on page load
         window.onload = function() {{
-            populateTable(allPlayers);
+            initTable();
+            loadPlayers().then(payload => {{
+                allPlayers = decodePlayers(payload.players);
+                scanNames = null;
+                sortOrders = {{}};
+                for (const [key, order] of Object.entries(payload.order || {{}})) sortOrders[key] = decodeOrder(order);
+                searchIndex = payload.search;
+                document.getElementById('lastUpdated').textContent = payload.updated;
+                showRows(allRows());
+                // Fold the names for broad searches after the first paint
+                setTimeout(searchNames, 0);
+            }}).catch(err => {{
+                document.getElementById('resultInfo').textContent = `Could not load player data: ${{err}}`;
+            }});
         }};
     </script>
 </body>
@@ -1134,16 +2291,136 @@ def create_interactive_html(players_data):
 
 def save_html(html_content, filename="index.html"):
     """
-    Save HTML content to file
+    Save HTML content to file. The file is written next to the target and
+    swapped in with os.replace, so readers never see a half-written page
     """
     filepath = Path(__file__).parent / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    _atomic_write(filepath, html_content)
     print(f"Interactive table saved to: {filepath}")
     return filepath
 
 
-def consolidate_multi_team_players(players_data):
+def save_split_html(players_data, filename="index.html"):
+    """
+    Save the page as a static shell (create_html_shell) plus a data file
+    named by the hash of its contents, written both plain and gzipped for
+    servers that send precompressed files. A small manifest names the
+    current data file. Files whose contents did not change are left alone,
+    so a refresh normally rewrites only the data file and the manifest;
+    all but the newest DATA_FILES_KEPT data files are deleted.
+    """
+    filepath = Path(__file__).parent / filename
+    data_dir = filepath.parent / DATA_DIR_NAME
+    data_dir.mkdir(exist_ok=True)
+
+    data = json.dumps(players_payload(players_data), separators=(',', ':')).encode('utf-8')
+    data_name = f"players.{hashlib.blake2b(data, digest_size=8).hexdigest()}.json"
+    if not (data_dir / data_name).exists():
+        _atomic_write(data_dir / f"{data_name}.gz", gzip.compress(data, mtime=0))
+        _atomic_write(data_dir / data_name, data)
+    else:
+        (data_dir / data_name).touch()
+    _write_if_changed(data_dir / DATA_MANIFEST_NAME, json.dumps({'data': data_name}))
+    _write_if_changed(filepath, create_html_shell())
+
+    data_files = sorted(data_dir.glob('players.*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in data_files[DATA_FILES_KEPT:]:
+        if old.name != data_name:
+            old.unlink(missing_ok=True)
+            old.with_name(f"{old.name}.gz").unlink(missing_ok=True)
+
+    print(f"Interactive table saved to: {filepath} (data: {DATA_DIR_NAME}/{data_name})")
+    return filepath
+
+
+COMBINED_TEAMS = frozenset(['2TM', '3TM'])
+
+
+class PlayerGroup:
+    """
+    All rows for one player, split into combined (2TM/3TM) and individual
+    team rows. Both partitions keep the original row order.
+    """
+    __slots__ = ('entries', 'combined', 'individual')
+
+    def __init__(self):
+        self.entries = []
+        self.combined = []
+        self.individual = []
+
+    def add(self, entry):
+        self.entries.append(entry)
+        if entry.team in COMBINED_TEAMS:
+            self.combined.append(entry)
+        else:
+            self.individual.append(entry)
+
+    def combined_with_team(self, team):
+        return [e for e in self.combined if e.team == team]
+
+
+class PlayerIndex:
+    """
+    Player -> PlayerGroup index of PlayerStat rows, built once after scraping and passed
+    through the post-processing stages so none of them has to regroup rows.
+    Players are identified by their basketball-reference ID (or, for rows
+    without one, their canonical name), interned to small ints: `groups` is
+    keyed by that int and `names` gives each player's display name.
+    Stages that drop or relabel rows update the index in place.
+    """
+
+    def __init__(self, players_data):
+        self.ids = {}
+        self.names = {}
+        self.by_name = {}
+        self.groups = {}
+        for player in players_data:
+            pid = self.intern(player)
+            group = self.groups.get(pid)
+            if group is None:
+                group = self.groups[pid] = PlayerGroup()
+            group.add(player)
+
+    def intern(self, player):
+        """
+        Small-int ID for a row's player (assigned in order of first appearance)
+        """
+        name = canon_name(player.player)
+        key = player.player_id or name
+        pid = self.ids.get(key)
+        if pid is None:
+            pid = self.ids[key] = len(self.ids)
+            self.names[pid] = player.player
+        self.by_name.setdefault(name, pid)
+        return pid
+
+    def lookup(self, name):
+        """
+        Interned ID of the player called `name` (any spelling that folds to
+        the same canonical name), or None
+        """
+        return self.by_name.get(canon_name(name))
+
+    def __len__(self):
+        return sum(len(g.entries) for g in self.groups.values())
+
+    def rows(self):
+        """
+        All indexed rows, grouped by player in order of first appearance
+        """
+        return [e for g in self.groups.values() for e in g.entries]
+
+    def set_team(self, pid, entry, team):
+        """
+        Relabel one of a player's rows, keeping the partitions in sync
+        """
+        group = self.groups[pid]
+        entry.team = team
+        group.combined = [e for e in group.entries if e.team in COMBINED_TEAMS]
+        group.individual = [e for e in group.entries if e.team not in COMBINED_TEAMS]
+
+
+def consolidate_multi_team_players(players_data, index=None):
     """
     For players who have been on 2 or more teams (without a 2TM entry),
     consolidate their stats:
@@ -1152,39 +2429,37 @@ def consolidate_multi_team_players(players_data):
     
     Returns: consolidated player list with multi-team players merged
     """
-    # Group players by name
-    player_groups = {}
-    for player in players_data:
-        name = player['Player']
-        if name not in player_groups:
-            player_groups[name] = []
-        player_groups[name].append(player)
+    if index is None:
+        index = PlayerIndex(players_data)
     
     result = []
-    for name, entries in player_groups.items():
+    for pid, group in index.groups.items():
+        name = index.names[pid]
+        entries = group.entries
         # Filter out 2TM entries - we'll handle those separately
-        individual_entries = [e for e in entries if e['Team'] != '2TM']
-        two_tm_entries = [e for e in entries if e['Team'] == '2TM']
+        two_tm_entries = group.combined_with_team('2TM')
+        individual_entries = [e for e in entries if e.team != '2TM'] if two_tm_entries else entries
         
         if len(individual_entries) > 1:
             # Player has multiple individual team entries
-            total_games = sum(e.get('G', 0) for e in individual_entries)
+            total_games = sum(e.g or 0 for e in individual_entries)
             
             print(f"Consolidating {name}: {len(individual_entries)} teams, {total_games} total games")
             
             if total_games > 15:
                 # Average stats across all teams
-                avg_player = {
-                    'Player': name,
-                    'Team': 'Multi-Team',  # Mark as multi-team
-                    'Rank': min(e.get('Rank', 999) for e in individual_entries),  # Use best rank
-                    'G': total_games,
-                    'FG%': round(sum(e.get('FG%', 0) for e in individual_entries) / len(individual_entries), 3),
-                    '2P%': round(sum(e.get('2P%', 0) for e in individual_entries) / len(individual_entries), 3),
-                    '3P%': round(sum(e.get('3P%', 0) for e in individual_entries) / len(individual_entries), 3),
-                    'First Made (Weighted)': 'Averaged (Multi-Team)',
-                    'Made 2 Likelihood (counts)': round(sum(e.get('Made 2 Likelihood (counts)', 0) for e in individual_entries) / len(individual_entries), 1),
-                }
+                avg_player = PlayerStat(
+                    player=name,
+                    team='Multi-Team',  # Mark as multi-team
+                    rank=min(999 if e.rank is None else e.rank for e in individual_entries),  # Use best rank
+                    g=total_games,
+                    fg_pct=round(sum(e.fg_pct or 0 for e in individual_entries) / len(individual_entries), 3),
+                    two_pct=round(sum(e.two_pct or 0 for e in individual_entries) / len(individual_entries), 3),
+                    three_pct=round(sum(e.three_pct or 0 for e in individual_entries) / len(individual_entries), 3),
+                    first_made_weighted='Averaged (Multi-Team)',
+                    made2_likelihood=round(sum(e.made2_likelihood or 0 for e in individual_entries) / len(individual_entries), 1),
+                    player_id=entries[0].player_id,
+                )
                 result.append(avg_player)
                 print(f"  -> Averaged across {len(individual_entries)} teams (> 15 games)")
             else:
@@ -1202,40 +2477,37 @@ def consolidate_multi_team_players(players_data):
     return result
 
 
-def prefer_2tm_rows(players_data):
+def prefer_2tm_rows(players_data, index=None):
     """
     For players with multiple entries (different teams + 2TM/3TM), keep only the combined row.
     This ensures we use combined stats for traded players.
     Handles 2TM (2 teams) and 3TM (3 teams) combined stats.
+    If a PlayerIndex is passed, the dropped rows are removed from it as well.
     """
-    # Group players by name
-    player_groups = {}
-    for player in players_data:
-        name = player['Player']
-        if name not in player_groups:
-            player_groups[name] = []
-        player_groups[name].append(player)
+    if index is None:
+        index = PlayerIndex(players_data)
     
     # Process each player group
     result = []
-    for name, entries in player_groups.items():
-        # Check if any entry has team='2TM' or '3TM' (combined stats)
-        combined_entries = [e for e in entries if e['Team'] in ['2TM', '3TM']]
-        individual_team_entries = [e for e in entries if e['Team'] not in ['2TM', '3TM']]
+    for pid, group in index.groups.items():
+        combined_entries = group.combined
+        individual_team_entries = group.individual
         
         if combined_entries and individual_team_entries:
             # Player has both combined (2TM/3TM) and individual team rows - prefer combined
             result.extend(combined_entries)
-            combined_label = ', '.join(set(e['Team'] for e in combined_entries))
-            print(f"Using {combined_label} row for {name} (preferred over {len(individual_team_entries)} individual team rows)")
+            group.entries = list(combined_entries)
+            group.individual = []
+            combined_label = ', '.join(set(e.team for e in combined_entries))
+            print(f"Using {combined_label} row for {index.names[pid]} (preferred over {len(individual_team_entries)} individual team rows)")
         else:
             # Player has only combined or only individual teams - keep all
-            result.extend(entries)
+            result.extend(group.entries)
     
     return result
 
 
-def dedupe_players(players_data):
+def dedupe_players(players_data, index=None):
     """
     Ensure only one entry per player remains.
     Priority when choosing which entry to keep:
@@ -1244,140 +2516,228 @@ def dedupe_players(players_data):
       3) the entry with the most games ('G')
       4) otherwise the first entry
     """
-    from collections import defaultdict
-    groups = defaultdict(list)
-    for p in players_data:
-        groups[p['Player']].append(p)
+    if index is None:
+        index = PlayerIndex(players_data)
 
     out = []
-    for name, entries in groups.items():
-        # prefer 3TM
-        three = [e for e in entries if e.get('Team') == '3TM']
-        if three:
-            out.append(three[0])
-            continue
-        two = [e for e in entries if e.get('Team') == '2TM']
-        if two:
-            out.append(two[0])
+    for group in index.groups.values():
+        if group.combined:
+            # prefer 3TM
+            three = group.combined_with_team('3TM')
+            out.append(three[0] if three else group.combined[0])
             continue
         # pick by most games if available
-        best = max(entries, key=lambda e: e.get('G', 0))
+        best = max(group.entries, key=lambda e: e.g or 0)
         out.append(best)
 
     return out
 
 
-def apply_manual_team_adjustments(players_data):
+# Trade adjustments: player name -> final team, maintained in a CSV file
+# (columns player, team, effective, note) so trades can be recorded without
+# editing code. Names are matched by canonical name (accents, case and
+# Jr./Sr. suffixes are ignored), so one spelling is enough. `effective` is an
+# optional YYYY-MM-DD date the move takes effect; when a player has several
+# rows the latest one in effect wins, and undated rows always apply.
+TEAM_ADJUSTMENTS_PATH = Path(__file__).parent / 'team_adjustments.csv'
+
+
+class TeamAdjustments:
+    """
+    The trade adjustment table, indexed by canonical player name with each
+    player's moves sorted by effective date. The file is re-read only when
+    its mtime changes, so a long-running process picks up edits on the next
+    current() call without a restart.
+    Teams found automatically (see resolve_final_teams) are kept as a
+    separate layer under the file: a manual row for the player overrides them.
+    """
+
+    def __init__(self, path=TEAM_ADJUSTMENTS_PATH):
+        self.path = Path(path)
+        self.mtime = None
+        self.loaded = False
+        self.by_name = {}
+        self.resolved = {}
+        self._lock = threading.Lock()
+
+    def reload_if_changed(self):
+        """
+        Re-read the file if its mtime changed since the last load.
+        Returns True if the table was reloaded
+        """
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            if self.loaded and mtime == self.mtime:
+                return False
+            entries = self._read() if mtime is not None else []
+            if mtime is None:
+                print(f"No team adjustments file at {self.path}")
+            by_name = {}
+            for name, team, effective in entries:
+                by_name.setdefault(canon_name(name), []).append((effective, team, name))
+            for moves in by_name.values():
+                moves.sort(key=lambda move: move[0])
+            self.by_name = by_name
+            self.mtime = mtime
+            self.loaded = True
+        if mtime is not None:
+            print(f"Loaded {len(entries)} team adjustments from {self.path.name}")
+        return True
+
+    def _read(self):
+        entries = []
+        try:
+            with open(self.path, newline='', encoding='utf-8') as f:
+                for line_no, row in enumerate(csv.DictReader(f), start=2):
+                    name = (row.get('player') or '').strip()
+                    team = (row.get('team') or '').strip()
+                    effective = (row.get('effective') or '').strip()
+                    if not name or not team:
+                        continue
+                    if effective:
+                        try:
+                            effective = date.fromisoformat(effective).isoformat()
+                        except ValueError:
+                            print(f"{self.path.name}:{line_no}: bad effective date {effective!r}, row skipped")
+                            continue
+                    entries.append((name, team, effective))
+        except (OSError, csv.Error) as e:
+            print(f"Could not read {self.path}: {str(e)[:150]}")
+        return entries
+
+    def set_resolved(self, teams):
+        """
+        Replace the automatically resolved layer with {player name: team}
+        """
+        self.resolved = {canon_name(name): (name, team) for name, team in teams.items()}
+
+    def current(self, as_of=None):
+        """
+        {player name: team} of the moves in effect on `as_of` (YYYY-MM-DD;
+        default today), reloading the file first if it changed. Resolved
+        teams only describe today, so they are left out for a past `as_of`
+        """
+        self.reload_if_changed()
+        day = as_of or date.today().isoformat()
+        manual = {}
+        for key, moves in self.by_name.items():
+            in_effect = [move for move in moves if move[0] <= day]
+            if in_effect:
+                _, team, name = in_effect[-1]
+                manual[key] = (name, team)
+        out = {}
+        if as_of is None or as_of >= date.today().isoformat():
+            out = {name: team for key, (name, team) in self.resolved.items() if key not in manual}
+        out.update(manual.values())
+        return out
+
+
+TEAM_ADJUSTMENTS = TeamAdjustments()
+
+
+class RosterRow(NamedTuple):
+    """
+    One row of a team roster table
+    """
+    player: str
+    player_id: Optional[str] = None
+
+
+def team_roster_url(team, season=CURRENT_SEASON, base_url=BBREF_BASE_URL):
+    return f"{base_url}/teams/{team}/{season}.html"
+
+
+def multi_team_players(players_data):
+    """
+    {player_id: name} of players with a combined 2TM/3TM row
+    (players_data is a PlayerStat list or a player DataFrame)
+    """
+    if isinstance(players_data, pd.DataFrame):
+        if 'player_id' not in players_data:
+            return {}
+        rows = zip(players_data['player'], players_data['team'], players_data['player_id'])
+    else:
+        rows = ((p.player, p.team, p.player_id) for p in players_data)
+    return {pid: name for name, team, pid in rows if team in COMBINED_TEAMS and isinstance(pid, str) and pid}
+
+
+def resolve_final_teams(players_data, base_url=BBREF_BASE_URL, season=CURRENT_SEASON, max_workers=4):
+    """
+    Work out the current team of every multi-team player from the 30 team
+    roster pages (fetched concurrently through the page cache, at most one
+    request every BACKFILL_REQUEST_INTERVAL seconds) by matching player IDs. Players found on no roster, or on more than one, are left out.
+    Returns {player name: team}, ready for TEAM_ADJUSTMENTS.set_resolved()
+    """
+    traded = multi_team_players(players_data)
+    if not traded:
+        return {}
+    print(f"Resolving final teams for {len(traded)} multi-team players from team rosters...")
+
+    teams = sorted(TEAM_CODES - COMBINED_TEAMS)
+    urls = {team: team_roster_url(team, season, base_url) for team in teams}
+    pages = fetch_pages(urls.values(), max_workers=max_workers, min_interval=BACKFILL_REQUEST_INTERVAL)
+
+    found = {}
+    for team, url in urls.items():
+        try:
+            html = pages.get(url)
+            rows = decode_table(html, 'roster', RosterRow, {}) if html else None
+        except Exception as e:
+            print(f"Could not read {team} roster: {str(e)[:150]}")
+            continue
+        for row in rows or []:
+            if row.player_id in traded:
+                found.setdefault(row.player_id, set()).add('PHX' if team == 'PHO' else team)
+
+    resolved = {}
+    for pid, name in traded.items():
+        on_rosters = found.get(pid, set())
+        if len(on_rosters) == 1:
+            resolved[name] = next(iter(on_rosters))
+        elif on_rosters:
+            print(f"{name} is on several rosters ({', '.join(sorted(on_rosters))}), not resolved")
+    print(f"Resolved {len(resolved)} of {len(traded)} multi-team players")
+    return resolved
+
+
+def apply_manual_team_adjustments(players_data, adjustments=None, index=None):
     """
     Apply manual team adjustments for recent trades.
     For players with 2TM as their team, reassign to their final team.
+    `adjustments` is a {player name: team} dict; by default the moves in
+    effect today from TEAM_ADJUSTMENTS.
     """
-    # Trade adjustments as of January 2026
-    # Maps player name to final team assignment
-    adjustments = {
-        'CJ McCollum': 'ATL',  # Traded from WAS to ATL, use 2TM stats and assign to ATL
-        'Corey Kispert': 'ATL',  # Traded from WAS to ATL
-        'Trae Young': 'WAS',  # Traded from ATL to WAS
-        'Jeremiah Robinson-Earl': 'DAL',
-        'PJ Hall': 'CHO',
-        'RayJ Dennis': 'ATL',  # Use 3TM stats and assign to ATL
-        'Christian Koloko': 'ATL',  # Use 3TM stats and assign to ATL
-        'Isaac Jones': 'DET',  # Traded from ATL to WAS
-        'Dennis Schroder': 'CLE',  # Traded to CLE
-        'Dennis Schröder': 'CLE',  # Traded to CLE (alternate spelling)
-        'De\'Andre Hunter': 'SAC',  # Traded to SAC
-        'Vit Krejci': 'POR',  # Traded to POR
-        'Keon Ellis': 'CLE',
-        'Mac McClung': 'CHI',  # Traded to CLE
-        'Charles Bassey': 'PHI',
-        'Patrick Baldwin Jr.': 'PHI',
-        'Jock Landale': 'ATL',
-        'Ochai Agbaji': 'BKN',
-        'Chris Paul': 'TOR',
-        'Lonzo Ball': 'UTA',
-        'Nikola Vučević': 'BOS',
-        'Anfernee Simons': 'CHI',
-        'Chris Boucher': 'UTA',
-        'Guerschon Yabusele': 'CHI',
-        'Dalen Terry': 'NYK',
-        'Ousmane Dieng': 'MIL',
-        'James Harden': 'CLE',
-        'Darius Garland': 'LAC',
-        'Jared McCain': 'OKC',
-        'Tyus Jones': 'DAL',
-        'Collin Sexton': 'CHI',
-        'Coby White': 'CHO',
-        'Vince Williams Jr.': 'UTA',
-        'John Konchar': 'UTA',
-        'Jaren Jackson Jr.': 'UTA',
-        'Walter Clayton JR.': 'MEM',
-        'Taylor Hendricks': 'MEM',
-        'Georges Niang': 'MEM',
-        'Kyle Anderson': 'MEM',
-        'Jaden Ivey': 'CHI',
-        'Kevin Huerter': 'DET',
-        'Dario Šarić': 'DET',
-        'Jonathan Kuminga': 'ATL',
-        'Kristaps Porziņģis': 'GSW',
-        'Marvin Bagley III': 'DAL',
-        'Khris Middleton': 'DAL',
-        'Buddy Hield': 'ATL',
-        'Ayo Dosunmu': 'MIN',
-        'Luke Kennard': 'LAL',
-        'Cam Thomas': 'MIL',
-        'Jose Alvarado:': 'NYK',
-        'Walter Clayton': 'MEM',
-        'Trayce Jackson-Davis': 'TOR',
-        'Gabe Vincent': 'ATL',
-        'Rob Dillingham': 'CHI',
-        'Jevon Carter': 'ORL',
-        'Nick Richards': 'CHI',
-        'Julian Phillips': 'MIN',
-        'AJ Johnson': 'DAL',
-        'Leonard Miller': 'CHI',
-        'Bennedict Mathurin': 'LAC',
-        'Kobe Brown': 'IND',
-        'Jose Alvarado': 'NYK',
-        'Jaden Hardy': 'WAS',
-        'Tyrese Martin': 'PHI',
-        'Isaiah Jackson': 'LAC',
-        'Jeremy Sochan': 'NYK',
-        'Amir Coffey': 'PHX',
-        'KJ Simpson': 'DEN',
-        'Xavier Tillman Sr.': 'CHO',
-        'Mo Bamba': 'UTA',
-        'Rayan Rupert': 'MEM',
-        'Josh Minott': 'BRK',
-        'Vít Krejčí': 'POR',
-        'Ivica Zubac': 'IND'
-    }
-    
+    if adjustments is None:
+        adjustments = TEAM_ADJUSTMENTS.current()
     adjusted_count = 0
 
-    # Group players by name for safe targeted reassignment
-    from collections import defaultdict
-    groups = defaultdict(list)
-    for p in players_data:
-        groups[p['Player']].append(p)
+    # Players grouped by identity for safe targeted reassignment; names are
+    # matched by canonical name, so any spelling of a player finds them
+    if index is None:
+        index = PlayerIndex(players_data)
 
+    adjusted = set()
     for name, new_team in adjustments.items():
-        entries = groups.get(name)
-        if not entries:
+        pid = index.lookup(name)
+        if pid is None or pid in adjusted:
             continue
+        adjusted.add(pid)
+        group = index.groups[pid]
 
         # Prefer assigning to a combined row if present (3TM > 2TM)
-        combined = [e for e in entries if e.get('Team') == '3TM']
-        if not combined:
-            combined = [e for e in entries if e.get('Team') == '2TM']
+        combined = group.combined_with_team('3TM') or group.combined
 
         if combined:
             target = combined[0]
         else:
             # No combined row - pick the entry with most games
-            target = max(entries, key=lambda e: e.get('G', 0))
+            target = max(group.entries, key=lambda e: e.g or 0)
 
-        old_team = target.get('Team')
-        target['Team'] = new_team
+        old_team = target.team
+        index.set_team(pid, target, new_team)
         adjusted_count += 1
         print(f"[OK] Adjusted {name}: {old_team} -> {new_team}")
 
@@ -1385,45 +2745,391 @@ def apply_manual_team_adjustments(players_data):
     return players_data
 
 
-def main():
+def process_players(players_data, index=None, adjustments=None):
     """
-    Main function to orchestrate the table creation
+    Post-process scraped (or sample) PlayerStat records into the final table rows:
+    prefer combined 2TM/3TM rows, apply trade adjustments, add 'First Made',
+    keep one row per player and sort by rank
+    `index` is the PlayerIndex for players_data; it is built here if not given
+    and shared by every stage. `adjustments` defaults to today's TEAM_ADJUSTMENTS
     """
-    # Try to scrape all NBA players
-    print("Attempting to scrape all NBA players from basketball-reference.com...")
-    players_data = scrape_nba_stats()
-    
-    # If scraping fails, use sample data
-    if players_data is None or len(players_data) == 0:
-        print("Scraping failed or no data found. Using sample data...")
-        players_data = create_sample_data()
-    
-    print(f"Loaded {len(players_data)} players")
+    if index is None:
+        index = PlayerIndex(players_data)
     
     # Prefer 2TM rows for players with multiple entries
-    players_data = prefer_2tm_rows(players_data)
+    players_data = prefer_2tm_rows(players_data, index)
     print(f"After preferring 2TM rows: {len(players_data)} players")
     
     # Manual team adjustments for recent trades
-    players_data = apply_manual_team_adjustments(players_data)
+    players_data = apply_manual_team_adjustments(players_data, adjustments, index=index)
     
     # Add calculated 'First Made' field
     players_data = add_first_made_calculation(players_data)
 
     # Final deduplication: keep only one entry per player (prefer 3TM -> 2TM -> most games)
-    players_data = dedupe_players(players_data)
+    players_data = dedupe_players(players_data, index)
     print(f"After deduplication: {len(players_data)} players")
     
+    # Sort by rank ascending (1 first) for default view
+    return sorted(players_data, key=lambda x: 999 if x.rank is None else x.rank)
+
+
+# ──────────────────────────────────────────────
+# DATAFRAME PIPELINE
+# Column-oriented versions of derive_player_stats() and process_players().
+# Frame columns are the PlayerStat field names, and the pipeline produces
+# exactly the same PlayerStat records, so either path can feed
+# create_interactive_html().
+# ──────────────────────────────────────────────
+
+# Columns that hold whole numbers but may be stored as float (NaN for missing)
+INT_COLUMNS = frozenset(['rank', 'g', 'team_rank', 'team_total'])
+
+def round_column(values, ndigits):
+    """
+    Vectorized round() that matches Python's round() exactly.
+    numpy rounds by scaling and calling rint, which can disagree with round()
+    when the scaled value lands on .5 through floating-point error; those
+    few values are re-rounded with round().
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, ndigits)
+    scaled = values * 10 ** ndigits
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(v, ndigits) for v in values[near_half].tolist()]
+    return rounded
+
+
+def derive_player_stats_frame(rows, prev_stats, cache=None, name_index=None):
+    """
+    DataFrame version of derive_player_stats(): the percentages, previous
+    season blending and first-made labels are computed as column operations
+    With a DerivedCache only the changed rows go through the column operations
+    """
+    if cache is not None:
+        parse = TotalsRowParser(prev_stats, name_index=name_index)
+        keys = [cache.unplayed_key(row) or parse.row_key(row) for row in rows]
+        stale = [(key, row) for key, row in zip(keys, rows) if key is not None and key not in cache.entries]
+        fresh = frame_to_players(derive_player_stats_frame([row for _, row in stale], prev_stats,
+                                                           name_index=name_index))
+        fresh_by_key = dict(zip((key for key, _ in stale), fresh))
+        for key, player in fresh_by_key.items():
+            cache.add(key, player)
+        players = []
+        for key in keys:
+            if key is None:
+                continue
+            player = PlayerStat(**dict(zip(DERIVED_FIELDS, cache.used[key]))) if key in cache.used else cache.get(key)
+            if player is not None:
+                players.append(player)
+        return players_frame(players)
+
+    columns = list(zip(*rows)) if rows else [()] * len(TotalsRow._fields)
+    df = pd.DataFrame({
+        field: np.array(values, dtype=object if field in ('player', 'team', 'rank', 'player_id') else None)
+        for field, values in zip(TotalsRow._fields, columns)
+    })
+    df = df[df['team'].isin(TEAM_CODES) & ~df['player'].str.isdigit()].reset_index(drop=True)
+
+    fg2 = df['fg2'].to_numpy(float)
+    fg2a = df['fg2a'].to_numpy(float)
+    fg3 = df['fg3'].to_numpy(float)
+    fg3a = df['fg3a'].to_numpy(float)
+    g = df['g'].to_numpy()
+    rank = pd.to_numeric(df['rank'], errors='coerce').to_numpy(float)
+    fg_pct = df['fg_pct'].to_numpy(float)
+
+    # Previous season row per player (ID, exact name, then canonical name);
+    # only low-games players use the previous season at all
+    blended = np.zeros(len(df), dtype=bool)
+    p_fg2, p_fg2a, p_fg3, p_fg3a, p_g = (np.zeros(len(df)) for _ in range(5))
+    p_rank = np.full(len(df), np.nan)
+    if prev_stats and len(df):
+        parse = TotalsRowParser(prev_stats, name_index=name_index)
+        low = np.flatnonzero(g < 15)
+        for i, name, player_id in zip(low, df['player'].to_numpy()[low], df['player_id'].to_numpy()[low]):
+            prev = parse.previous(name, player_id)
+            if prev is not None:
+                p_fg2[i], p_fg2a[i], p_fg3[i], p_fg3a[i], p_g[i] = prev.fg2, prev.fg2a, prev.fg3, prev.fg3a, prev.g
+                if isinstance(prev.rank, int):
+                    p_rank[i] = prev.rank
+        blended = (g < 15) & (p_g > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Current season only
+        two_pct = np.where(fg2a > 0, fg2 / fg2a, 0.0)
+        three_pct = np.where(fg3a > 0, fg3 / fg3a, 0.0)
+        made_total = fg2 + fg3
+        made2 = np.where(made_total > 0, (fg2 / made_total) * 100.0, 0.0)
+        label = np.select([fg2 > fg3, fg3 > fg2], ['Made 2', 'Made 3'], 'Tied')
+
+        # Averaged with the previous season
+        avg_fg2 = (fg2 + p_fg2) / 2.0
+        avg_fg2a = (fg2a + p_fg2a) / 2.0
+        avg_fg3 = (fg3 + p_fg3) / 2.0
+        avg_fg3a = (fg3a + p_fg3a) / 2.0
+        total_made = avg_fg2 + avg_fg3
+        total_att = avg_fg2a + avg_fg3a
+        two_pct = np.where(blended, np.where(avg_fg2a > 0, avg_fg2 / avg_fg2a, 0.0), two_pct)
+        three_pct = np.where(blended, np.where(avg_fg3a > 0, avg_fg3 / avg_fg3a, 0.0), three_pct)
+        fg_pct = np.where(blended & (total_att > 0), total_made / total_att, fg_pct)
+        made2 = np.where(blended, np.where(total_made > 0, (avg_fg2 / total_made) * 100.0, 0.0), made2)
+        avg_label = np.select([avg_fg2 > avg_fg3, avg_fg3 > avg_fg2], ['Made 2 (Avg)', 'Made 3 (Avg)'], 'Tied (Avg)')
+        label = np.where(blended, avg_label, label)
+        # Better (lower) ranking of the two seasons
+        rank = np.where(blended, np.fmin(rank, p_rank), rank)
+
+    return pd.DataFrame({
+        'player': df['player'],
+        'team': df['team'].replace('PHO', 'PHX'),
+        'rank': rank,
+        'g': df['g'],
+        'fg_pct': round_column(fg_pct, 3),
+        'two_pct': round_column(two_pct, 3),
+        'three_pct': round_column(three_pct, 3),
+        'first_made_weighted': label,
+        'made2_likelihood': round_column(made2, 1),
+        'player_id': df['player_id'],
+    })
+
+
+def _identity_keys(df):
+    """
+    Player identity per row, as in PlayerIndex.intern(): the player ID, or
+    the canonical name for rows without one
+    """
+    ids = df['player_id'].tolist() if 'player_id' in df else [None] * len(df)
+    return [pid if isinstance(pid, str) and pid else canon_name(name)
+            for pid, name in zip(ids, df['player'].tolist())]
+
+
+def _group_codes(df):
+    """
+    Integer group id per row for each player identity, numbered in order of first appearance
+    """
+    return pd.factorize(pd.Series(_identity_keys(df), dtype=object))[0]
+
+
+def _entry_priority(df):
+    """
+    Sort keys for picking a player's row: 3TM first, then 2TM, then most games
+    """
+    team = df['team']
+    priority = np.select([team == '3TM', team == '2TM'], [0, 1], 2)
+    games = df['g'].fillna(0).to_numpy(float) if 'g' in df else np.zeros(len(df))
+    return priority, np.where(priority == 2, -games, 0.0)
+
+
+def prefer_2tm_rows_frame(df):
+    """
+    DataFrame version of prefer_2tm_rows()
+    """
+    if df.empty:
+        return df
+    codes = _group_codes(df)
+    n_groups = codes.max() + 1
+    is_combined = df['team'].isin(['2TM', '3TM']).to_numpy()
+    has_combined = np.bincount(codes, weights=is_combined, minlength=n_groups) > 0
+    has_individual = np.bincount(codes, weights=~is_combined, minlength=n_groups) > 0
+    both = has_combined & has_individual
+
+    # Log each affected player, in the same order as prefer_2tm_rows()
+    names = df['player'].to_numpy()
+    teams = df['team'].to_numpy()
+    n_individual = np.bincount(codes, weights=~is_combined, minlength=n_groups).astype(int)
+    first_row = np.unique(codes, return_index=True)[1]
+    labels = {}
+    for i in np.flatnonzero(both[codes] & is_combined):
+        labels.setdefault(codes[i], set()).add(teams[i])
+    for code in sorted(labels):
+        print(f"Using {', '.join(labels[code])} row for {names[first_row[code]]} (preferred over {n_individual[code]} individual team rows)")
+
+    keep = ~(both[codes] & ~is_combined)
+    # Rows come out grouped by player, in order of each player's first row
+    order = np.argsort(codes[keep], kind='stable')
+    return df[keep].iloc[order].reset_index(drop=True)
+
+
+def apply_manual_team_adjustments_frame(df, adjustments=None):
+    """
+    DataFrame version of apply_manual_team_adjustments()
+    """
+    if adjustments is None:
+        adjustments = TEAM_ADJUSTMENTS.current()
+    df = df.copy()
+    codes = _group_codes(df)
+
+    # Adjustment name -> player group, by canonical name; one adjustment per player
+    by_name = {}
+    for name, code in zip(df['player'].tolist(), codes.tolist()):
+        by_name.setdefault(canon_name(name), code)
+    resolved = {}
+    for name, new_team in adjustments.items():
+        code = by_name.get(canon_name(name))
+        if code is not None and code not in resolved:
+            resolved[code] = (name, new_team)
+
+    mask = np.isin(codes, list(resolved))
+    candidates = df[mask]
+    candidate_codes = codes[mask]
+    priority, games_key = _entry_priority(candidates)
+    order = np.lexsort((np.arange(len(candidates)), games_key, priority, candidate_codes))
+    sorted_codes = candidate_codes[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    targets = candidates.iloc[order[first]]
+    old_teams = dict(zip(sorted_codes[first].tolist(), targets['team'].tolist()))
+    df.loc[targets.index, 'team'] = [resolved[code][1] for code in sorted_codes[first].tolist()]
+
+    for code, (name, new_team) in resolved.items():
+        print(f"[OK] Adjusted {name}: {old_teams[code]} -> {new_team}")
+    print(f"Total adjustments applied: {len(resolved)}")
+    return df
+
+
+def add_first_made_calculation_frame(df):
+    """
+    DataFrame version of add_first_made_calculation()
+    """
+    df = df.copy()
+    two_pct = df['two_pct'].fillna(0) if 'two_pct' in df else pd.Series(0, index=df.index)
+    three_pct = df['three_pct'].fillna(0) if 'three_pct' in df else pd.Series(0, index=df.index)
+    label = pd.Series(np.select([two_pct > three_pct, three_pct > two_pct], ['Made 2', 'Made 3'], 'Tied'),
+                      index=df.index)
+    if 'first_made' in df:
+        label = df['first_made'].where(df['first_made'].notna(), label)
+    df['first_made'] = label
+    return df
+
+
+def dedupe_players_frame(df):
+    """
+    DataFrame version of dedupe_players()
+    """
+    if df.empty:
+        return df
+    codes = _group_codes(df)
+    priority, games_key = _entry_priority(df)
+    order = np.lexsort((np.arange(len(df)), games_key, priority, codes))
+    sorted_codes = codes[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    return df.iloc[order[first]].reset_index(drop=True)
+
+
+def players_frame(players):
+    """
+    DataFrame with one column per PlayerStat field
+    """
+    columns = [f.name for f in fields(PlayerStat)]
+    return pd.DataFrame.from_records(
+        [tuple(getattr(p, c) for c in columns) for p in players], columns=columns)
+
+
+def frame_to_players(df):
+    """
+    Convert a player DataFrame back into PlayerStat records (missing values become None)
+    """
+    columns = list(df.columns)
+    column_values = []
+    for col in columns:
+        series = df[col]
+        values = series.tolist()
+        missing = series.isna().to_numpy()
+        if col in INT_COLUMNS:
+            values = [None if m else int(v) for v, m in zip(values, missing)]
+        elif missing.any():
+            values = [None if m else v for v, m in zip(values, missing)]
+        column_values.append(values)
+    return [PlayerStat(**dict(zip(columns, row))) for row in zip(*column_values)]
+
+
+def process_players_frame(df, adjustments=None):
+    """
+    DataFrame version of process_players(); returns the same list of PlayerStat records
+    """
+    df = prefer_2tm_rows_frame(df)
+    print(f"After preferring 2TM rows: {len(df)} players")
+
+    df = apply_manual_team_adjustments_frame(df, adjustments)
+    df = add_first_made_calculation_frame(df)
+
+    df = dedupe_players_frame(df)
+    print(f"After deduplication: {len(df)} players")
+
+    if 'rank' in df:
+        df = df.iloc[np.argsort(df['rank'].fillna(999).to_numpy(), kind='stable')]
+    return frame_to_players(df)
+
+
+def main(use_pandas=False, store=None, as_of=None, prior_seasons=1, resolve_teams=False,
+         sample_fallback=True, played_teams=None, split_data=False, from_store=False):
+    """
+    Main function to orchestrate the table creation
+    (use_pandas=True runs the DataFrame pipeline; the output is identical)
+    Scrapes are saved to `store` (a StatsStore) when given; with `as_of`
+    the table is rebuilt from the stored snapshot instead of scraping, and
+    with from_store=True from the latest one (e.g. after a trade edit when
+    no game has finished).
+    resolve_teams=True looks up traded players' current teams on the team
+    roster pages; team_adjustments.csv still overrides them.
+    With sample_fallback=False a failed scrape leaves the existing output
+    untouched and returns (None, None).
+    `played_teams` is passed on to scrape_nba_stats().
+    split_data=True writes a static shell plus a hashed data file
+    (save_split_html) instead of one page with the data inlined
+    """
+    if as_of or from_store:
+        print(f"Loading stored NBA stats as of {as_of or 'the latest snapshot'}...")
+        totals = load_snapshot_totals(store, as_of, prior_seasons=prior_seasons) if store is not None else None
+        name_index = stored_name_index(store, CURRENT_SEASON, prior_seasons) if totals else None
+        players_data = players_from_totals(totals, as_frame=use_pandas, name_index=name_index) if totals else None
+        # Resolved teams only describe today, so a past as_of does without them
+        if resolve_teams and not as_of and players_data is not None:
+            with browser_session():
+                TEAM_ADJUSTMENTS.set_resolved(resolve_final_teams(players_data))
+    else:
+        # Try to scrape all NBA players
+        print("Attempting to scrape all NBA players from basketball-reference.com...")
+        with browser_session():
+            players_data = scrape_nba_stats(as_frame=use_pandas, store=store, prior_seasons=prior_seasons,
+                                            played_teams=played_teams)
+            if resolve_teams and players_data is not None:
+                TEAM_ADJUSTMENTS.set_resolved(resolve_final_teams(players_data))
+    
+    # If scraping fails, use sample data
+    if players_data is None or len(players_data) == 0:
+        if not sample_fallback:
+            print("Scraping failed or no data found. Keeping the previous output.")
+            return None, None
+        print("Scraping failed or no data found. Using sample data...")
+        players_data = [PlayerStat.from_dict(p) for p in create_sample_data()]
+        if use_pandas:
+            players_data = players_frame(players_data)
+    
+    print(f"Loaded {len(players_data)} players")
+    
+    # Trade adjustments in effect on the table's date
+    adjustments = TEAM_ADJUSTMENTS.current(as_of)
+    
+    if use_pandas:
+        players_data = process_players_frame(players_data, adjustments)
+    else:
+        # Group rows by player once; every post-processing stage shares it
+        index = PlayerIndex(players_data)
+        players_data = process_players(players_data, index, adjustments)
+    
     # Get unique teams
-    teams = sorted(set(p['Team'] for p in players_data))
+    teams = sorted(set(p.team for p in players_data))
     print(f"Teams: {', '.join(teams)}")
     
-    # Sort by rank ascending (1 first) for default view
-    players_data = sorted(players_data, key=lambda x: x.get('Rank', 999))
-    
     # Create and save HTML
-    html_content = create_interactive_html(players_data)
-    filepath = save_html(html_content)
+    if split_data:
+        filepath = save_split_html(players_data)
+    else:
+        html_content = create_interactive_html(players_data)
+        filepath = save_html(html_content)
     
     # print(f"\n✅ Success! Open the HTML file in your browser to interact with the stats table.")
     # print(f"You can:")
@@ -1435,12 +3141,134 @@ def main():
     return players_data, filepath
 
 
+def table_built_at(split_data=False, filename="index.html"):
+    """
+    When main() last wrote the table (a timestamp), or None if it never did.
+    In split mode the newest data file counts, since the shell is only
+    rewritten when the template changes
+    """
+    filepath = Path(__file__).parent / filename
+    paths = (filepath.parent / DATA_DIR_NAME).glob('players.*.json') if split_data else [filepath]
+    return max((p.stat().st_mtime for p in paths if p.exists()), default=None)
+
+
+def run_daemon(interval=60 * 60, game_aware=False, espn_base=None, **main_kwargs):
+    """
+    Keep one warm process refreshing the table every `interval` seconds:
+    the HTTP session, browser pool, page cache, decoded last-season rows,
+    stats store and trade adjustments all stay loaded between runs.
+    Each run swaps in the new index.html atomically; a failed run keeps the
+    previous one. Stops on Ctrl+C.
+    With game_aware=True (needs a store) a run is skipped when no game went
+    final since the last snapshot, only the teams that played are
+    recomputed, and the next check comes early when a game is about to
+    settle (see plan_refresh). A skipped run still rebuilds the table from
+    the latest snapshot when team_adjustments.csv changed.
+    """
+    print(f"Refresh daemon started (every {interval / 60:g} min). Press Ctrl+C to stop.")
+    store = main_kwargs.get('store')
+    try:
+        with browser_session():
+            while True:
+                started = time.monotonic()
+                plan = plan_refresh(store, espn_base=espn_base) if game_aware and store is not None else None
+                try:
+                    if plan is None or plan.scrape:
+                        main(sample_fallback=False, played_teams=plan and plan.played_teams, **main_kwargs)
+                    elif TEAM_ADJUSTMENTS.reload_if_changed():
+                        print("No game has gone final, but the team adjustments changed; "
+                              "rebuilding from the last snapshot")
+                        main(sample_fallback=False, from_store=True, **main_kwargs)
+                    else:
+                        print("No game has gone final since the last snapshot; skipping this refresh")
+                except Exception as e:
+                    print(f"Refresh failed: {str(e)[:150]}")
+                delay = max(0.0, interval - (time.monotonic() - started))
+                if plan is not None and plan.next_final is not None:
+                    until_final = (plan.next_final - datetime.now(timezone.utc)).total_seconds()
+                    delay = min(delay, max(MIN_REFRESH_INTERVAL, until_final))
+                print(f"Next refresh at {time.strftime('%H:%M', time.localtime(time.time() + delay))}")
+                time.sleep(delay)
+    except KeyboardInterrupt:
+        print("Refresh daemon stopped")
+
+
+def cli(argv=None):
+    """
+    Command line entry point; `argv` defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description="Build the interactive NBA FG% table.")
+    parser.add_argument("--pandas", action="store_true",
+                        help="Process stats with the DataFrame pipeline (same output)")
+    parser.add_argument("--no-store", action="store_true",
+                        help="Don't save this scrape to the local stats store")
+    parser.add_argument("--as-of", type=str, default=None, metavar="YYYY-MM-DD",
+                        help="Build the table from the stored snapshot of this date instead of scraping")
+    parser.add_argument("--prior-seasons", type=int, default=1, metavar="N",
+                        help="Seasons back a low-games player may blend with (older ones come from the store; default: 1)")
+    parser.add_argument("--resolve-teams", action="store_true",
+                        help="Find traded players' current teams from the team roster pages "
+                             "(team_adjustments.csv still overrides them)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep running and refresh the table on a schedule")
+    parser.add_argument("--interval", type=float, default=60, metavar="MINUTES",
+                        help="Minutes between daemon refreshes (default: 60)")
+    parser.add_argument("--game-aware", action="store_true",
+                        help="Check the ESPN scoreboard first: skip the scrape if no game went final "
+                             "since the last snapshot and only recompute the teams that played")
+    parser.add_argument("--espn-base", type=str, default=None, metavar="URL",
+                        help="ESPN API base URL for --game-aware (e.g. a local stub server)")
+    parser.add_argument("--split-data", action="store_true",
+                        help="Write index.html as a static shell plus a content-hashed, gzipped data file under data/")
+    parser.add_argument("--backfill", type=str, default=None, metavar="FIRST-LAST",
+                        help="Load the totals of seasons FIRST..LAST (e.g. 2015-2025) into the store and exit")
+    args = parser.parse_args(argv)
+
+    if args.backfill:
+        try:
+            first, last = (int(part) for part in args.backfill.split('-'))
+        except ValueError:
+            parser.error("--backfill expects FIRST-LAST, e.g. 2015-2025")
+        with StatsStore(record_type=TotalsRow) as store, browser_session():
+            backfill_seasons(store, first, last)
+        return
+
+    if not args.no_store:
+        store = StatsStore(record_type=TotalsRow)
+    elif (args.as_of or args.prior_seasons > 1) and STATS_DB_PATH.exists():
+        # Stored seasons are still read; this run is not saved
+        store = StatsStore(record_type=TotalsRow, read_only=True)
+    else:
+        store = None
+    options = dict(use_pandas=args.pandas, store=store, prior_seasons=args.prior_seasons,
+                   resolve_teams=args.resolve_teams, split_data=args.split_data)
+    if args.game_aware and (args.no_store or args.as_of):
+        parser.error("--game-aware needs the stats store and live data (no --no-store or --as-of)")
+    if args.daemon:
+        if args.as_of:
+            parser.error("--daemon refreshes live data and can't be combined with --as-of")
+        run_daemon(interval=args.interval * 60, game_aware=args.game_aware, espn_base=args.espn_base, **options)
+    elif args.game_aware:
+        plan = plan_refresh(store, espn_base=args.espn_base)
+        built_at = table_built_at(args.split_data)
+        if plan.scrape:
+            players_data, filepath = main(played_teams=plan.played_teams, **options)
+        elif built_at is None or (TEAM_ADJUSTMENTS.path.exists()
+                                  and TEAM_ADJUSTMENTS.path.stat().st_mtime > built_at):
+            print("No game has gone final, but the team adjustments changed; rebuilding from the last snapshot")
+            players_data, filepath = main(from_store=True, **options)
+        else:
+            print("No game has gone final since the last snapshot; keeping the current table")
+    else:
+        players_data, filepath = main(as_of=args.as_of, **options)
+
+
 if __name__ == "__main__":
-    # Uncomment to scrape dunk stats
-    # dunk_data = scrape_dunk_stats()
+    # Uncomment to scrape dunk stats (fetched in parallel with the totals pages)
+    # _, dunk_data = scrape_all_stats()
     # if dunk_data:
     #     print("\nDunk Stats Sample:")
     #     for p in dunk_data[:5]:
     #         print(p)
     
-    players_data, filepath = main()
\ No newline at end of file
+    cli()
\ No newline at end of file
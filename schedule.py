@@ -9,11 +9,16 @@ Usage:
     python fetch_weekly_schedule.py --leagues nba nhl mlb
     python fetch_weekly_schedule.py --output schedule.csv
     python fetch_weekly_schedule.py --days 7
+    python fetch_weekly_schedule.py --espn-base http://127.0.0.1:8766   # local stub
 """
 
-import urllib.request
 import json
 import argparse
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
@@ -30,25 +35,53 @@ LEAGUES = {
     "wnba":  ("basketball", "wnba"),
 }
 
-ESPN_BASE = "https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/scoreboard"
+# Scheme and host of the ESPN API; point ESPN_BASE_URL (or --espn-base) at a
+# local server to run against stubbed responses
+ESPN_BASE_URL = os.environ.get("ESPN_BASE_URL", "https://site.api.espn.com")
+ESPN_PATH = "/apis/site/v2/sports/{sport}/{league}/scoreboard"
+ESPN_BASE = ESPN_BASE_URL + ESPN_PATH
 
 ET = ZoneInfo("America/New_York")
 
+# Most requests in flight at once
+MAX_WORKERS = 8
+# Events asked for per date-range request (ESPN pages ranges otherwise)
+RANGE_EVENT_LIMIT = 1000
+
 
 # ──────────────────────────────────────────────
 # FETCH
 # ──────────────────────────────────────────────
 
-def fetch_schedule(sport: str, league: str, date_str: str) -> list[dict]:
-    """Fetch games for a single league on a single date (YYYYMMDD)."""
-    url = ESPN_BASE.format(sport=sport, league=league) + f"?dates={date_str}"
-    try:
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read())
-    except Exception as e:
-        print(f"  ⚠️  Failed to fetch {league} for {date_str}: {e}")
-        return []
+_session = None
+_session_lock = threading.Lock()
+
 
+def http_session() -> requests.Session:
+    """Shared keep-alive session with a connection pool sized for MAX_WORKERS.
+    requests follows redirects and honors HTTP(S)_PROXY / NO_PROXY."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+    return _session
+
+
+def fetch_json(url: str, timeout: float = 10):
+    """GET a JSON document over the shared session; raises on an HTTP error status."""
+    resp = http_session().get(url, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def parse_events(data: dict, league: str, date_str: str | None = None) -> list[dict]:
+    """Game dicts from a scoreboard response. `date_str` is the day the games
+    were requested for; without it (a date-range request) each game's date
+    is its start date in ET."""
     games = []
     for event in data.get("events", []):
         comp = event.get("competitions", [{}])[0]
@@ -67,10 +100,12 @@ def fetch_schedule(sport: str, league: str, date_str: str) -> list[dict]:
 
         # Parse start time to ET
         start_raw = event.get("date", "")
+        game_date = date_str
         try:
             dt_utc = datetime.fromisoformat(start_raw.replace("Z", "+00:00"))
             dt_et = dt_utc.astimezone(ET)
             time_str = dt_et.strftime("%-I:%M %p ET")
+            game_date = game_date or dt_et.strftime("%Y%m%d")
         except Exception:
             time_str = start_raw
 
@@ -79,8 +114,9 @@ def fetch_schedule(sport: str, league: str, date_str: str) -> list[dict]:
 
         game = {
             "league":     league.upper().replace("MENS-COLLEGE-BASKETBALL", "NCAAB"),
-            "date":       date_str,
+            "date":       game_date or "",
             "time":       time_str,
+            "start":      start_raw,
             "away":       away or "?",
             "home":       home or "?",
             "status":     status,
@@ -93,20 +129,69 @@ def fetch_schedule(sport: str, league: str, date_str: str) -> list[dict]:
     return games
 
 
-def fetch_week(league_keys: list[str], days: int = 7) -> list[dict]:
-    """Fetch games for all requested leagues over the next N days."""
-    today = datetime.now(tz=ET).date()
-    dates = [(today + timedelta(days=i)).strftime("%Y%m%d") for i in range(days)]
+def scoreboard_url(sport: str, league: str, dates: str, base_url: str | None = None) -> str:
+    base = (base_url.rstrip("/") + ESPN_PATH) if base_url else ESPN_BASE
+    url = base.format(sport=sport, league=league) + f"?dates={dates}"
+    # Date ranges are paged; ask for every event at once
+    return url + f"&limit={RANGE_EVENT_LIMIT}" if "-" in dates else url
 
-    all_games = []
+
+def fetch_schedule(sport: str, league: str, date_str: str, base_url: str | None = None,
+                   strict: bool = False) -> list[dict]:
+    """Fetch games for a single league on a single date (YYYYMMDD).
+    A failed request returns [] unless strict=True, which re-raises it."""
+    try:
+        data = fetch_json(scoreboard_url(sport, league, date_str, base_url))
+    except Exception as e:
+        if strict:
+            raise
+        print(f"  ⚠️  Failed to fetch {league} for {date_str}: {e}")
+        return []
+    return parse_events(data, league, date_str)
+
+
+def fetch_range(sport: str, league: str, dates: list[str], base_url: str | None = None) -> list[dict]:
+    """Fetch a league's games on consecutive dates (YYYYMMDD) with one
+    date-range request. Raises on failure, including a response that may
+    have been cut off at RANGE_EVENT_LIMIT events."""
+    data = fetch_json(scoreboard_url(sport, league, f"{dates[0]}-{dates[-1]}", base_url))
+    if len(data.get("events", [])) >= RANGE_EVENT_LIMIT:
+        raise ValueError(f"{league} {dates[0]}-{dates[-1]}: {RANGE_EVENT_LIMIT} events, response may be truncated")
+    wanted = set(dates)
+    return [g for g in parse_events(data, league) if g["date"] in wanted]
+
+
+def fetch_week(league_keys: list[str], days: int = 7, start=None, base_url: str | None = None,
+               strict: bool = False, max_workers: int = MAX_WORKERS) -> list[dict]:
+    """Fetch games for all requested leagues over N days from `start` (default today, ET).
+    Requests run concurrently (at most `max_workers` at once): one date-range
+    request per league, falling back to one request per day for a league
+    whose range request fails or hits RANGE_EVENT_LIMIT."""
+    first = start or datetime.now(tz=ET).date()
+    dates = [(first + timedelta(days=i)).strftime("%Y%m%d") for i in range(days)]
+
+    leagues = []
     for key in league_keys:
         if key not in LEAGUES:
             print(f"Unknown league: {key}")
             continue
-        sport, league = LEAGUES[key]
         print(f"Fetching {key.upper()}...")
-        for d in dates:
-            games = fetch_schedule(sport, league, d)
+        leagues.append(LEAGUES[key])
+
+    def league_range(sport_league):
+        try:
+            return fetch_range(*sport_league, dates, base_url)
+        except Exception:
+            return None
+
+    all_games = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        by_range = list(pool.map(league_range, leagues)) if len(dates) > 1 else [None] * len(leagues)
+        per_day = [(sport, league, d) for (sport, league), games in zip(leagues, by_range)
+                   if games is None for d in dates]
+        for games in by_range:
+            all_games.extend(games or [])
+        for games in pool.map(lambda job: fetch_schedule(*job, base_url, strict), per_day):
             all_games.extend(games)
 
     # Sort by date then time
@@ -181,6 +266,10 @@ def main():
         "--days", type=int, default=7,
         help="Number of days ahead to fetch (default: 7)"
     )
+    parser.add_argument(
+        "--espn-base", type=str, default=None,
+        help=f"ESPN API base URL (default: {ESPN_BASE_URL})"
+    )
     parser.add_argument(
         "--output", type=str, default=None,
         help="Save results to file. Use .csv or .json extension."
@@ -190,7 +279,7 @@ def main():
     print(f"\n🏟️  Fetching schedule for: {', '.join(l.upper() for l in args.leagues)}")
     print(f"📅  Next {args.days} days starting today\n")
 
-    games = fetch_week(args.leagues, args.days)
+    games = fetch_week(args.leagues, args.days, base_url=args.espn_base)
 
     print_schedule(games)
     print(f"\n📊  Total games found: {len(games)}")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Local stats store
+Keeps every scrape of a season totals table as a dated snapshot in SQLite
+(stdlib sqlite3, no server), so runs can be diffed against each other and
+old tables rebuilt without re-scraping.
+
+Usage:
+    python stats_store.py                       # list snapshots
+    python stats_store.py --player "Trae Young" # a player's history
+    python stats_store.py --team ATL --season 2026 --date 2026-01-15
+"""
+
+import argparse
+import json
+import sqlite3
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+# ──────────────────────────────────────────────
+# CONFIG
+# ──────────────────────────────────────────────
+
+STATS_DB_PATH = Path(__file__).parent / 'stats.db'
+
+# Stored per player row; matches the fields of nbafg.TotalsRow
+TOTALS_COLUMNS = ('player', 'team', 'rank', 'g', 'fg_pct', 'fg2', 'fg2a', 'fg3', 'fg3a', 'player_id')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id       INTEGER PRIMARY KEY,
+    season   INTEGER NOT NULL,
+    taken_at TEXT NOT NULL,
+    source   TEXT,
+    checked_at TEXT
+);
+CREATE TABLE IF NOT EXISTS player_totals (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    player TEXT NOT NULL,
+    team   TEXT,
+    rank   INTEGER,
+    g      INTEGER,
+    fg_pct REAL,
+    fg2    INTEGER,
+    fg2a   INTEGER,
+    fg3    INTEGER,
+    fg3a   INTEGER,
+    player_id TEXT
+);
+CREATE TABLE IF NOT EXISTS player_names (
+    season     INTEGER NOT NULL,
+    canon_name TEXT NOT NULL,
+    player_key TEXT NOT NULL,
+    PRIMARY KEY (season, canon_name)
+);
+CREATE TABLE IF NOT EXISTS derived_rows (
+    row_hash TEXT PRIMARY KEY,
+    derived  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_season_taken ON snapshots(season, taken_at);
+CREATE INDEX IF NOT EXISTS snapshots_taken ON snapshots(taken_at);
+CREATE INDEX IF NOT EXISTS player_totals_snapshot ON player_totals(snapshot_id);
+CREATE INDEX IF NOT EXISTS player_totals_player ON player_totals(player, snapshot_id);
+CREATE INDEX IF NOT EXISTS player_totals_team ON player_totals(team, snapshot_id);
+"""
+
+# Default record type for loaded rows
+SnapshotRow = namedtuple('SnapshotRow', TOTALS_COLUMNS)
+
+
+def utc_now():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+def day_end(date_str):
+    """
+    Upper bound for "on or before this date": a bare YYYY-MM-DD covers the whole day
+    """
+    return f"{date_str}T23:59:59+00:00" if len(date_str) == 10 else date_str
+
+
+# ──────────────────────────────────────────────
+# STORE
+# ──────────────────────────────────────────────
+
+class StatsStore:
+    """
+    SQLite file of season totals snapshots. Each snapshot is one scrape of
+    one season's totals table; rows are stored as TOTALS_COLUMNS.
+    Rows are returned as `record_type(**columns)` (SnapshotRow by default).
+    With read_only=True an existing file is opened for reading only;
+    any write raises sqlite3.OperationalError.
+    """
+
+    def __init__(self, path=STATS_DB_PATH, record_type=SnapshotRow, read_only=False):
+        self.path = Path(path)
+        self.record_type = record_type
+        self.read_only = read_only
+        if read_only:
+            self.conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            self.conn.row_factory = sqlite3.Row
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """
+        Bring stores created by older versions up to SCHEMA
+        """
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(player_totals)')}
+        snapshot_columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(snapshots)')}
+        with self.conn:
+            if 'player_id' not in columns:
+                self.conn.execute('ALTER TABLE player_totals ADD COLUMN player_id TEXT')
+            if 'checked_at' not in snapshot_columns:
+                self.conn.execute('ALTER TABLE snapshots ADD COLUMN checked_at TEXT')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS player_totals_player_id ON player_totals(player_id, snapshot_id)')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _records(self, cursor):
+        return [self.record_type(**{c: row[c] for c in TOTALS_COLUMNS}) for row in cursor]
+
+    def save_snapshot(self, season, rows, source=None, taken_at=None):
+        """
+        Store rows (objects with TOTALS_COLUMNS attributes) as a new snapshot of
+        `season`. Returns the snapshot id.
+        """
+        with self.conn:
+            cur = self.conn.execute(
+                'INSERT INTO snapshots (season, taken_at, source) VALUES (?, ?, ?)',
+                (season, taken_at or utc_now(), source))
+            snapshot_id = cur.lastrowid
+            self.conn.executemany(
+                f"INSERT INTO player_totals (snapshot_id, {', '.join(TOTALS_COLUMNS)}) "
+                f"VALUES (?, {', '.join('?' * len(TOTALS_COLUMNS))})",
+                ((snapshot_id, *(getattr(r, c) for c in TOTALS_COLUMNS)) for r in rows))
+        return snapshot_id
+
+    def mark_checked(self, snapshot_id, checked_at=None):
+        """
+        Record that a later scrape found a snapshot's rows unchanged, instead
+        of storing an identical copy
+        """
+        with self.conn:
+            self.conn.execute('UPDATE snapshots SET checked_at = ? WHERE id = ?',
+                              (checked_at or utc_now(), snapshot_id))
+
+    def snapshots(self, season=None):
+        """
+        Snapshot summaries (id, season, taken_at, source, checked_at, rows), oldest first.
+        checked_at is when a later scrape last found the rows unchanged (or None)
+        """
+        sql = ('SELECT s.id, s.season, s.taken_at, s.source, s.checked_at, COUNT(t.snapshot_id) AS rows '
+               'FROM snapshots s LEFT JOIN player_totals t ON t.snapshot_id = s.id')
+        params = ()
+        if season is not None:
+            sql += ' WHERE s.season = ?'
+            params = (season,)
+        sql += ' GROUP BY s.id ORDER BY s.taken_at, s.id'
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def latest_snapshot(self, season, as_of=None):
+        """
+        Id of the newest snapshot of `season` taken on or before `as_of`
+        (an ISO date/time; default now), or None
+        """
+        sql = 'SELECT id FROM snapshots WHERE season = ?'
+        params = [season]
+        if as_of:
+            sql += ' AND taken_at <= ?'
+            params.append(day_end(as_of))
+        row = self.conn.execute(sql + ' ORDER BY taken_at DESC, id DESC LIMIT 1', params).fetchone()
+        return row['id'] if row else None
+
+    def load_rows(self, snapshot_id):
+        """
+        All rows of a snapshot, in the order they were scraped
+        """
+        cur = self.conn.execute(
+            f"SELECT {', '.join(TOTALS_COLUMNS)} FROM player_totals WHERE snapshot_id = ? ORDER BY rowid",
+            (snapshot_id,))
+        return self._records(cur)
+
+    def season_rows(self, season, as_of=None):
+        """
+        Rows of the newest snapshot of `season` on or before `as_of` ([] if none)
+        """
+        snapshot_id = self.latest_snapshot(season, as_of)
+        return self.load_rows(snapshot_id) if snapshot_id is not None else []
+
+    def player_history(self, player, season=None):
+        """
+        (taken_at, row) for every stored snapshot containing `player`, oldest first
+        """
+        sql = (f"SELECT s.taken_at, {', '.join('t.' + c for c in TOTALS_COLUMNS)} "
+               'FROM player_totals t JOIN snapshots s ON s.id = t.snapshot_id WHERE t.player = ?')
+        params = [player]
+        if season is not None:
+            sql += ' AND s.season = ?'
+            params.append(season)
+        rows = list(self.conn.execute(sql + ' ORDER BY s.taken_at, t.rowid', params))
+        return [(row['taken_at'], rec) for row, rec in zip(rows, self._records(rows))]
+
+    def team_rows(self, team, season, as_of=None):
+        """
+        A team's rows from the newest snapshot of `season` on or before `as_of`
+        """
+        snapshot_id = self.latest_snapshot(season, as_of)
+        if snapshot_id is None:
+            return []
+        cur = self.conn.execute(
+            f"SELECT {', '.join(TOTALS_COLUMNS)} FROM player_totals "
+            'WHERE team = ? AND snapshot_id = ? ORDER BY rowid',
+            (team, snapshot_id))
+        return self._records(cur)
+
+    def save_name_index(self, season, index):
+        """
+        Replace the stored name index of `season` ({canonical name: player key})
+        """
+        with self.conn:
+            self.conn.execute('DELETE FROM player_names WHERE season = ?', (season,))
+            self.conn.executemany(
+                'INSERT INTO player_names (season, canon_name, player_key) VALUES (?, ?, ?)',
+                ((season, name, key) for name, key in index.items()))
+
+    def load_name_index(self, season):
+        """
+        {canonical name: player key} stored for `season`, or None if there is none
+        """
+        rows = self.conn.execute(
+            'SELECT canon_name, player_key FROM player_names WHERE season = ?', (season,)).fetchall()
+        return {row['canon_name']: row['player_key'] for row in rows} or None
+
+    def load_derived(self):
+        """
+        {row hash: derived values} saved by the last save_derived()
+        """
+        return {row['row_hash']: json.loads(row['derived'])
+                for row in self.conn.execute('SELECT row_hash, derived FROM derived_rows')}
+
+    def save_derived(self, entries):
+        """
+        Replace the derived-values cache with `entries` ({row hash: JSON-able values});
+        only the rows of the latest run are kept
+        """
+        with self.conn:
+            self.conn.execute('DELETE FROM derived_rows')
+            self.conn.executemany(
+                'INSERT INTO derived_rows (row_hash, derived) VALUES (?, ?)',
+                ((key, json.dumps(values)) for key, values in entries.items()))
+
+
+def row_key(row):
+    return (row.player_id or row.player, row.team)
+
+
+def diff_rows(old_rows, new_rows):
+    """
+    Compare two snapshots' rows by (player ID or name, team).
+    Returns {'added': [...], 'removed': [...], 'changed': [...]} of keys
+    """
+    old = {row_key(r): r for r in old_rows}
+    new = {row_key(r): r for r in new_rows}
+    return {
+        'added': [k for k in new if k not in old],
+        'removed': [k for k in old if k not in new],
+        'changed': [k for k in new if k in old and tuple(new[k]) != tuple(old[k])],
+    }
+
+
+# ──────────────────────────────────────────────
+# MAIN
+# ──────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the local stats store.")
+    parser.add_argument("--db", type=str, default=str(STATS_DB_PATH),
+                        help=f"Store path (default: {STATS_DB_PATH.name})")
+    parser.add_argument("--season", type=int, default=None, help="Restrict to one season")
+    parser.add_argument("--player", type=str, default=None, help="Show a player's snapshot history")
+    parser.add_argument("--team", type=str, default=None, help="Show a team's rows (needs --season)")
+    parser.add_argument("--date", type=str, default=None,
+                        help="With --team: use the newest snapshot on or before YYYY-MM-DD")
+    args = parser.parse_args()
+
+    with StatsStore(args.db) as store:
+        if args.player:
+            for taken_at, row in store.player_history(args.player, args.season):
+                print(f"{taken_at}  {row.team:<4} G {row.g:>3}  "
+                      f"2P {row.fg2}/{row.fg2a}  3P {row.fg3}/{row.fg3a}")
+        elif args.team:
+            if args.season is None:
+                parser.error("--team needs --season")
+            for row in store.team_rows(args.team, args.season, args.date):
+                print(f"{row.player:<28} G {row.g:>3}  "
+                      f"2P {row.fg2}/{row.fg2a}  3P {row.fg3}/{row.fg3a}")
+        else:
+            for snap in store.snapshots(args.season):
+                checked = f"  (unchanged at {snap['checked_at']})" if snap['checked_at'] else ''
+                print(f"#{snap['id']:<5} {snap['season']}  {snap['taken_at']}  {snap['rows']:>4} rows  "
+                      f"{snap['source'] or ''}{checked}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+The command line: which options save to the stats store. The scrape and
+the page write are patched out; the store is a temporary file.
+"""
+import functools
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import nbafg
+from stats_store import StatsStore
+
+
+def row(player, team, rank, g=20):
+    return nbafg.TotalsRow(player, team, rank, g, 0.5, 50, 100, 10, 30, player.lower().replace(' ', '') + '01')
+
+
+ROWS = [row(f"Player {i}", 'ATL' if i % 2 else 'BOS', i + 1) for i in range(120)]
+
+
+class NoStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = Path(tmp.name) / 'stats.db'
+        with StatsStore(self.db, record_type=nbafg.TotalsRow) as store:
+            store.save_snapshot(nbafg.CURRENT_SEASON - 2, ROWS, taken_at='2024-04-15T12:00:00+00:00')
+        for target, value in (('STATS_DB_PATH', self.db),
+                              ('StatsStore', functools.partial(StatsStore, self.db)),
+                              ('scrape_totals', mock.Mock(return_value=(ROWS, {}))),
+                              ('save_html', mock.Mock(return_value=Path(tmp.name) / 'index.html'))):
+            patcher = mock.patch.object(nbafg, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def stored(self):
+        with StatsStore(self.db) as store:
+            snapshots = store.snapshots()
+            derived = store.conn.execute('SELECT COUNT(*) FROM derived_rows').fetchone()[0]
+        return len(snapshots), derived
+
+    def test_no_store_with_prior_seasons_writes_nothing(self):
+        nbafg.cli(['--no-store', '--prior-seasons', '3'])
+        nbafg.save_html.assert_called_once()
+        self.assertEqual(self.stored(), (1, 0))
+
+    def test_scrape_is_saved_by_default(self):
+        nbafg.cli(['--prior-seasons', '3'])
+        snapshots, derived = self.stored()
+        self.assertEqual(snapshots, 2)
+        self.assertGreater(derived, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+fetch_page() against a saved basketball-reference page served by a local
+http.server: comment-wrapped tables, the page cache, ETag revalidation and
+rate limiting.
+"""
+import hashlib
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+import nbafg
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+class SavedPageHandler(BaseHTTPRequestHandler):
+    """
+    Serves tests/fixtures/<name> for /leagues/<name>, with a strong ETag
+    and 304 Not Modified when If-None-Match matches
+    """
+    requests_seen = []
+
+    def do_GET(self):
+        if self.path.startswith('/limited/'):
+            self.send_response(429)
+            self.send_header('Retry-After', '3600')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        path = FIXTURES / Path(self.path).name
+        if not path.is_file():
+            self.send_error(404)
+            return
+        body = path.read_bytes()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.requests_seen.append((self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchPageTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), SavedPageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        SavedPageHandler.requests_seen = []
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = nbafg.PageCache(tmp.name)
+        self.url = nbafg.season_totals_url(nbafg.CURRENT_SEASON, self.base_url)
+        selenium = mock.patch('nbafg.fetch_html_selenium', return_value=None)
+        self.selenium = selenium.start()
+        self.addCleanup(selenium.stop)
+
+    def test_decodes_commented_table(self):
+        saved = (FIXTURES / f"NBA_{nbafg.CURRENT_SEASON}_totals.html").read_text(encoding='utf-8')
+        self.assertIsNone(nbafg.decode_totals(saved))
+        html = nbafg.fetch_page(self.url, cache=self.cache)
+        rows = nbafg.decode_totals(html)
+        self.assertEqual(rows, (
+            nbafg.TotalsRow('Dennis Schröder', '2TM', 1, 40, 0.412, 109, 237, 61, 176, 'schrode01'),
+            nbafg.TotalsRow('Dennis Schröder', 'SAC', 1, 12, 0.4, 33, 75, 17, 50, 'schrode01'),
+            nbafg.TotalsRow('Devin Booker', 'PHO', 2, 9, 0.0, 51, 98, 20, 55, 'bookede01'),
+        ))
+        self.selenium.assert_not_called()
+
+    def test_fresh_cache_hit_skips_network(self):
+        first = nbafg.fetch_page(self.url, cache=self.cache)
+        second = nbafg.fetch_page(self.url, cache=self.cache)
+        self.assertEqual(first, second)
+        self.assertEqual(len(SavedPageHandler.requests_seen), 1)
+
+    def test_stale_entry_revalidates_with_etag(self):
+        first = nbafg.fetch_page(self.url, cache=self.cache)
+        _, meta = self.cache.get(self.url)
+        self.assertTrue(meta['etag'])
+        with mock.patch('nbafg.CURRENT_SEASON_TTL', 0):
+            second = nbafg.fetch_page(self.url, cache=self.cache)
+        self.assertEqual(first, second)
+        self.assertEqual(SavedPageHandler.requests_seen, [
+            (f"/leagues/NBA_{nbafg.CURRENT_SEASON}_totals.html", None),
+            (f"/leagues/NBA_{nbafg.CURRENT_SEASON}_totals.html", meta['etag']),
+        ])
+        _, revalidated = self.cache.get(self.url)
+        self.assertGreaterEqual(revalidated['fetched_at'], meta['fetched_at'])
+        self.selenium.assert_not_called()
+
+    def test_past_season_kept_only_if_fetched_after_it_ended(self):
+        season = nbafg.CURRENT_SEASON - 1
+        url = nbafg.season_totals_url(season, self.base_url)
+        ended = nbafg.season_end(season)
+        # Fetched during that season's playoffs: may still change, so revalidate
+        self.assertFalse(self.cache.is_fresh(url, {'fetched_at': ended - 86400}))
+        self.assertTrue(self.cache.is_fresh(url, {'fetched_at': ended + 1}))
+        team_url = f"{self.base_url}/teams/BOS/{season}.html"
+        self.assertFalse(self.cache.is_fresh(team_url, {'fetched_at': ended - 86400}))
+        self.assertTrue(self.cache.is_fresh(team_url, {'fetched_at': ended}))
+
+    def test_rate_limit_skips_selenium(self):
+        url = f"{self.base_url}/limited/NBA_{nbafg.CURRENT_SEASON}_totals.html"
+        self.assertIsNone(nbafg.fetch_page(url, cache=self.cache))
+        self.selenium.assert_not_called()
+
+
+
+class DriverPoolTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch('nbafg.create_chrome_driver', side_effect=lambda: mock.Mock())
+        self.create = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = nbafg.DriverPool()
+
+    def test_clean_borrow_is_reused(self):
+        with self.pool.driver() as first:
+            pass
+        with self.pool.driver() as second:
+            pass
+        self.assertIs(first, second)
+        first.quit.assert_not_called()
+
+    def test_failed_borrow_quits_driver(self):
+        for error in (ValueError, KeyboardInterrupt):
+            with self.assertRaises(error):
+                with self.pool.driver() as drv:
+                    raise error()
+            drv.quit.assert_called_once()
+        with self.pool.driver() as fresh:
+            self.assertIsNot(fresh, drv)
+        self.assertEqual(self.create.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+The generated page's virtual scrolling and shipped sort orders, run under
+Node against a small DOM stub in which rows are not all the same height.
+"""
+import json
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+import nbafg
+
+# Rows with long names lay out taller, as a wrapped row would
+PAGE_HARNESS = r"""
+const fs = require('fs');
+const script = fs.readFileSync(process.argv[1], 'utf8').match(/<script>([\s\S]*)<\/script>/)[1];
+
+let heightReads = 0;
+class Element {
+    constructor(tag) { this.tagName = tag; this.children = []; this.style = {}; this.className = '';
+                       this.text = ''; this.value = ''; this.scrollTop = 0; this.clientHeight = 800; }
+    get firstChild() { return this.children[0]; }
+    appendChild(c) { this.children.push(c); return c; }
+    insertBefore(c, ref) { this.children.splice(this.children.indexOf(ref), 0, c); return c; }
+    addEventListener(type, fn) { this['on' + type] = fn; }
+    set textContent(v) { this.children = []; this.text = String(v); }
+    get textContent() { return this.text; }
+    get offsetHeight() {
+        heightReads++;
+        return this.slots && this.slots[1].text.length > 12 ? 61 : 44;
+    }
+}
+const byId = {};
+global.document = {
+    getElementById: id => byId[id] || (byId[id] = new Element('div')),
+    createElement: tag => new Element(tag),
+};
+const windowEvents = {};
+global.window = {addEventListener(type, fn) { windowEvents[type] = fn; }};
+global.requestAnimationFrame = fn => fn();
+eval(script + ';global.page = {populateTable, sortOrder, get all() { return allPlayers; },' +
+     'get sortOrders() { return sortOrders; }};');
+
+function shown() {
+    const rows = document.getElementById('tableBody').children.filter(
+        r => r.className.startsWith('player-row') && r.style.display !== 'none');
+    return rows.map(r => r.slots[0].text);
+}
+
+window.onload();
+setTimeout(() => {
+    const out = {first: shown(), reads_first: heightReads};
+    const wrapper = document.getElementById('tableWrapper');
+    for (const top of [1000, 2777, 5000, 123]) {
+        wrapper.scrollTop = top;
+        wrapper.onscroll();
+    }
+    out.reads_scrolled = heightReads;
+    out.scrolled = shown();
+    windowEvents.resize();
+    out.reads_resized = heightReads;
+    // Orders shipped by Python against the page's own first-click sort
+    out.shipped = {};
+    for (const key of Object.keys(page.sortOrders)) {
+        const shipped = page.sortOrders[key];
+        delete page.sortOrders[key];
+        out.shipped[key] = JSON.stringify(page.sortOrder(key)) === JSON.stringify(shipped);
+    }
+    console.log(JSON.stringify(out));
+}, 0);
+"""
+
+
+def players(count):
+    """
+    Display dicts whose names alternate between short and long; FG% has
+    ties and a few missing values
+    """
+    rows = [{'Player': f"P {i}" if i % 2 else f"Longer Player Name {i}", 'Team': 'BOS',
+             'Rank': i + 1, 'G': 40, 'FG%': (i * 37 % 50) / 100, '2P%': 0.55, '3P%': 0.35}
+            for i in range(count)]
+    for p in rows[::11]:
+        del p['FG%']
+    return rows
+
+
+@unittest.skipIf(shutil.which('node') is None, "node not found on PATH")
+class PageTest(unittest.TestCase):
+    def render(self, count):
+        with tempfile.TemporaryDirectory() as tmp:
+            page = Path(tmp) / 'index.html'
+            page.write_text(nbafg.create_interactive_html(players(count)), encoding='utf-8')
+            proc = subprocess.run([shutil.which('node'), '-e', PAGE_HARNESS, str(page)],
+                                  capture_output=True, text=True, timeout=60)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        return json.loads(proc.stdout)
+
+    def test_rows_of_different_heights(self):
+        out = self.render(300)
+        # The row height is measured once, not on every render or scroll
+        self.assertEqual(out['reads_first'], 1)
+        self.assertEqual(out['reads_scrolled'], 1)
+        self.assertEqual(out['reads_resized'], 2)
+        self.assertEqual(out['first'][0], '1')
+        self.assertTrue(out['scrolled'])
+        # The rendered rows are a contiguous run of the table
+        ranks = [int(r) for r in out['scrolled']]
+        self.assertEqual(ranks, list(range(ranks[0], ranks[0] + len(ranks))))
+
+    def test_shipped_orders_match_page_sort(self):
+        out = self.render(300)
+        self.assertEqual(out['shipped'], {key: True for key in nbafg.SHIPPED_SORT_KEYS})
+
+
+if __name__ == '__main__':
+    unittest.main()
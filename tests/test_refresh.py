@@ -0,0 +1,193 @@
+"""
+Game-aware refreshes: plan_refresh() against a canned ESPN scoreboard served
+by a local http.server, and reusing derived rows for teams that did not play.
+"""
+import json
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import nbafg
+from schedule import ET
+from stats_store import StatsStore
+
+SNAPSHOT_TAKEN = '2026-01-10T12:00:00+00:00'
+NOW = datetime(2026, 1, 11, 6, 0, tzinfo=timezone.utc)
+
+
+def event(start, away, home, state):
+    return {
+        'date': start,
+        'competitions': [{
+            'competitors': [
+                {'homeAway': 'home', 'team': {'abbreviation': home}, 'score': '100'},
+                {'homeAway': 'away', 'team': {'abbreviation': away}, 'score': '98'},
+            ],
+            'status': {'type': {'name': 'STATUS_FINAL' if state == 'post' else 'STATUS_IN_PROGRESS',
+                                'state': state}},
+        }],
+    }
+
+
+def et_day(event):
+    return datetime.fromisoformat(event['date'].replace('Z', '+00:00')).astimezone(ET).strftime('%Y%m%d')
+
+
+class ScoreboardHandler(BaseHTTPRequestHandler):
+    """
+    Serves `events` for the ET dates asked for in ?dates=YYYYMMDD[-YYYYMMDD],
+    or a 500 for every request when `failing` is set
+    """
+    events = []
+    failing = False
+
+    def do_GET(self):
+        if self.failing:
+            self.send_error(500)
+            return
+        first, _, last = parse_qs(urlsplit(self.path).query)['dates'][0].partition('-')
+        last = last or first
+        body = json.dumps({'events': [e for e in self.events if first <= et_day(e) <= last]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def row(player, team, rank, g=20, fg2=50):
+    return nbafg.TotalsRow(player, team, rank, g, 0.5, fg2, 100, 10, 30, player.lower().replace(' ', '')[:8] + '01')
+
+
+class PlanRefreshTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ScoreboardHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.espn_base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ScoreboardHandler.events = []
+        ScoreboardHandler.failing = False
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = StatsStore(Path(tmp.name) / 'stats.db', record_type=nbafg.TotalsRow)
+        self.addCleanup(self.store.close)
+        self.snapshot_id = self.store.save_snapshot(nbafg.CURRENT_SEASON, [row('A Player', 'ATL', 1)],
+                                                    taken_at=SNAPSHOT_TAKEN)
+
+    def plan(self):
+        return nbafg.plan_refresh(self.store, espn_base=self.espn_base, now=NOW)
+
+    def test_no_games_skips_scrape(self):
+        self.assertEqual(self.plan(), nbafg.RefreshPlan(False, None, None))
+
+    def test_final_games_since_snapshot(self):
+        ScoreboardHandler.events = [
+            # Settled before the snapshot was taken
+            event('2026-01-10T06:00Z', 'UTAH', 'SA', 'post'),
+            event('2026-01-11T00:00Z', 'PHX', 'BKN', 'post'),
+            event('2026-01-11T03:00Z', 'GS', 'NY', 'in'),
+        ]
+        self.assertEqual(self.plan(), nbafg.RefreshPlan(
+            True, frozenset({'PHO', 'BRK'}), datetime(2026, 1, 11, 7, 0, tzinfo=timezone.utc)))
+
+    def test_recent_final_waits_to_settle(self):
+        # Final, but basketball-reference may not have it until 07:00Z
+        ScoreboardHandler.events = [event('2026-01-11T03:00Z', 'GS', 'NY', 'post')]
+        self.assertEqual(self.plan(), nbafg.RefreshPlan(
+            False, None, datetime(2026, 1, 11, 7, 0, tzinfo=timezone.utc)))
+
+    def test_unchanged_check_counts_as_fresh(self):
+        ScoreboardHandler.events = [event('2026-01-11T00:00Z', 'PHX', 'BKN', 'post')]
+        self.store.mark_checked(self.snapshot_id, '2026-01-11T05:00:00+00:00')
+        self.assertEqual(self.plan(), nbafg.RefreshPlan(False, None, None))
+
+    def test_unreachable_scoreboard_scrapes(self):
+        ScoreboardHandler.failing = True
+        self.assertEqual(self.plan(), nbafg.RefreshPlan(True, None, None))
+
+    def test_no_snapshot_scrapes(self):
+        self.assertEqual(nbafg.plan_refresh(self.store, season=nbafg.CURRENT_SEASON + 1,
+                                            espn_base=self.espn_base, now=NOW),
+                         nbafg.RefreshPlan(True, None, None))
+
+
+class DerivedCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = StatsStore(Path(tmp.name) / 'stats.db', record_type=nbafg.TotalsRow)
+        self.addCleanup(self.store.close)
+
+    def refresh(self, rows, played_teams=None):
+        """
+        The store half of scrape_nba_stats(): snapshot, derive through the cache, save
+        """
+        diff = nbafg.record_snapshot(self.store, (rows, {}))
+        cache = nbafg.load_derived_cache(self.store, played_teams, diff)
+        players = nbafg.derive_player_stats(rows, {}, cache=cache)
+        self.store.save_derived(cache.used)
+        return players, cache
+
+    def test_unplayed_team_reuses_unchanged_rows(self):
+        rows = [row('A Player', 'ATL', 1), row('B Player', 'BOS', 2)]
+        self.refresh(rows)
+        played = [rows[0]._replace(g=21, fg2=55), rows[1]]
+        players, cache = self.refresh(played, frozenset({'ATL'}))
+        self.assertEqual(players, nbafg.derive_player_stats(played, {}))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNotNone(cache.unplayed_key(played[1]))
+
+    def test_rank_shift_on_unplayed_team_is_recomputed(self):
+        self.refresh([row('A Player', 'ATL', 1), row('B Player', 'BOS', 2)])
+        rows = [row('A Player', 'ATL', 1), row('Aa New', 'ATL', 2), row('B Player', 'BOS', 3)]
+        players, _ = self.refresh(rows, frozenset({'ATL'}))
+        self.assertEqual([(p.player, p.rank) for p in players],
+                         [('A Player', 1), ('Aa New', 2), ('B Player', 3)])
+
+
+
+class FromStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = StatsStore(Path(tmp.name) / 'stats.db', record_type=nbafg.TotalsRow)
+        self.addCleanup(self.store.close)
+        rows = [row(f"Player {i}", 'ATL' if i % 2 else 'BOS', i + 1) for i in range(120)]
+        self.store.save_snapshot(nbafg.CURRENT_SEASON, rows, taken_at=SNAPSHOT_TAKEN)
+        for target in ('resolve_final_teams', 'save_html'):
+            patcher = mock.patch.object(nbafg, target, return_value={})
+            self.addCleanup(patcher.stop)
+            setattr(self, target, patcher.start())
+        patcher = mock.patch.object(nbafg.TEAM_ADJUSTMENTS, 'set_resolved')
+        self.addCleanup(patcher.stop)
+        self.set_resolved = patcher.start()
+
+    def test_rebuild_from_store_resolves_teams(self):
+        self.resolve_final_teams.return_value = {'Player 1': 'BOS'}
+        players, _ = nbafg.main(store=self.store, from_store=True, resolve_teams=True, sample_fallback=False)
+        self.assertIsNotNone(players)
+        self.resolve_final_teams.assert_called_once()
+        self.set_resolved.assert_called_once_with({'Player 1': 'BOS'})
+
+    def test_past_snapshot_skips_resolving(self):
+        nbafg.main(store=self.store, as_of=SNAPSHOT_TAKEN[:10], resolve_teams=True, sample_fallback=False)
+        self.resolve_final_teams.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
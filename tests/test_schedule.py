@@ -0,0 +1,75 @@
+"""
+schedule.py's fetches against a local http.server standing in for ESPN.
+"""
+import json
+import os
+import threading
+import unittest
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import schedule
+
+GAME = {
+    'date': '2026-01-11T00:30Z',
+    'competitions': [{
+        'competitors': [
+            {'homeAway': 'home', 'team': {'abbreviation': 'BOS'}, 'score': '101'},
+            {'homeAway': 'away', 'team': {'abbreviation': 'ATL'}, 'score': '99'},
+        ],
+        'status': {'type': {'name': 'STATUS_FINAL', 'state': 'post'}},
+    }],
+}
+
+
+class ESPNHandler(BaseHTTPRequestHandler):
+    """
+    Answers every request with one game and records the request paths
+    """
+    protocol_version = 'HTTP/1.1'
+    seen = []
+
+    def do_GET(self):
+        self.seen.append(self.path)
+        body = json.dumps({'events': [GAME]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchJsonTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ESPNHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ESPNHandler.seen = []
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        for name in ('http_proxy', 'HTTP_PROXY', 'https_proxy', 'HTTPS_PROXY', 'no_proxy', 'NO_PROXY'):
+            os.environ.pop(name, None)
+
+    def test_full_range_falls_back_to_days(self):
+        with mock.patch('schedule.RANGE_EVENT_LIMIT', 1):
+            games = schedule.fetch_week(['nba'], 2, start=date(2026, 1, 10), base_url=self.base_url)
+        self.assertEqual([g['date'] for g in games], ['20260110', '20260111'])
+        self.assertEqual(sorted(path.partition('?')[2] for path in ESPNHandler.seen),
+                         ['dates=20260110', 'dates=20260110-20260111&limit=1', 'dates=20260111'])
+
+
+if __name__ == '__main__':
+    unittest.main()